@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+batch_pipeline.py — Screen a list of tickers end to end in one process.
+
+Runs EDGAR lookup + download → S-1 parse → CTgov fetch-all → comparison
+for every ticker, as an overlapped pipeline: network stages run in thread
+pools, parsing runs in a process pool, and stages are joined by bounded
+queues so a slow stage applies back-pressure instead of piling up work.
+One JSON line is written per ticker/candidate as soon as it is ready.
+
+Usage:
+    python scripts/batch_pipeline.py --tickers ipo_calendar.txt --output results.jsonl
+    python scripts/batch_pipeline.py --tickers ipo_calendar.txt --work-dir data/ \
+        --net-workers 4 --parse-workers 8
+
+The tickers file has one ticker per line; blank lines and lines starting
+with # are ignored.
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import ctgov_fetch
+import edgar_fetch
+import s1_parser
+from comparison_builder import build_comparison
+from filing_archive import get_archive
+
+NET_WORKERS = 4
+QUEUE_SIZE = 8
+
+_DONE = object()  # end-of-stream marker, one per downstream worker
+
+
+def _parse_filing(filepath: str, use_cache: bool) -> dict:
+    """Process-pool task: find_candidates for one filing."""
+    cache = s1_parser.ParseCache() if use_cache else None
+    result = s1_parser.cached_find_candidates(filepath, cache=cache)
+    if cache:
+        cache.flush_stats()
+    return result
+
+
+def _read_tickers(path: str) -> list[str]:
+    tickers = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                tickers.append(line.upper())
+    return tickers
+
+
+def _error_record(ticker: str, stage: str, err: BaseException, started: float) -> dict:
+    return {
+        "ticker": ticker,
+        "stage": stage,
+        "status": "error",
+        "error": str(err) or type(err).__name__,
+        "elapsed_s": round(time.monotonic() - started, 2),
+    }
+
+
+def run_batch(
+    tickers: list[str],
+    work_dir: str,
+    out,
+    net_workers: int = NET_WORKERS,
+    parse_workers: int = None,
+    queue_size: int = QUEUE_SIZE,
+    max_results: int = 50,
+    use_cache: bool = True,
+) -> dict:
+    """Run the pipeline over ``tickers``, writing JSONL records to ``out``.
+
+    Returns counts of records written by status.
+    """
+    parse_workers = parse_workers or os.cpu_count() or 1
+    ticker_q = queue.Queue()
+    filing_q = queue.Queue(maxsize=queue_size)      # (ticker, started, filing)
+    candidate_q = queue.Queue(maxsize=queue_size)   # (ticker, started, filing, s1_dir, s1_data, name)
+    out_q = queue.Queue()
+
+    for ticker in tickers:
+        ticker_q.put(ticker)
+    for _ in range(net_workers):
+        ticker_q.put(_DONE)
+
+    # One archive for every edgar thread, so index updates share a lock
+    archive = get_archive()
+
+    def edgar_stage():
+        while (ticker := ticker_q.get()) is not _DONE:
+            started = time.monotonic()
+            try:
+                meta = edgar_fetch.lookup(ticker)
+                path = edgar_fetch.download(
+                    ticker, meta["document_url"], meta["filing_date"],
+                    meta["accession_number"], meta["form_type"], archive=archive,
+                )
+            except (Exception, SystemExit) as e:  # lookup exits on unknown tickers
+                out_q.put(_error_record(ticker, "edgar", e, started))
+                continue
+            filing_q.put((ticker, started, {**meta, "file_path": path}))
+
+    def parse_stage(pool: ProcessPoolExecutor):
+        while (item := filing_q.get()) is not _DONE:
+            ticker, started, filing = item
+            # Any failure becomes a record: a dead parse thread would leave
+            # the edgar threads blocked on filing_q.
+            try:
+                s1_data = pool.submit(_parse_filing, filing["file_path"], use_cache).result()
+                s1_dir = os.path.join(work_dir, ticker)
+                os.makedirs(s1_dir, exist_ok=True)
+                with open(os.path.join(s1_dir, "s1_candidates.json"), "w", encoding="utf-8") as f:
+                    json.dump(s1_data, f, indent=2, ensure_ascii=False)
+            except Exception as e:
+                out_q.put(_error_record(ticker, "parse", e, started))
+                continue
+
+            names = [c["name"] for c in s1_data.get("candidates", [])]
+            if not names:
+                out_q.put({
+                    "ticker": ticker,
+                    "stage": "parse",
+                    "status": "no_candidates",
+                    "filing": filing,
+                    "elapsed_s": round(time.monotonic() - started, 2),
+                })
+            for name in names:
+                candidate_q.put((ticker, started, filing, s1_dir, s1_data, name))
+
+    def ctgov_stage():
+        while (item := candidate_q.get()) is not _DONE:
+            ticker, started, filing, s1_dir, s1_data, name = item
+            try:
+                manifest = ctgov_fetch.fetch_all_for_drug(name, s1_dir, max_results=max_results)
+                comparison = {}
+                if manifest["search_hits"]:
+                    comparison = build_comparison(s1_data, name, manifest["output_dir"])
+            except Exception as e:
+                record = _error_record(ticker, "ctgov", e, started)
+                record["candidate"] = name
+                out_q.put(record)
+                continue
+            if not manifest["search_hits"]:
+                status = "no_studies"
+            else:
+                status = "error" if "error" in comparison else "ok"
+            out_q.put({
+                "ticker": ticker,
+                "stage": "compare",
+                "status": status,
+                "candidate": name,
+                "filing": filing,
+                "severity_summary": comparison.get("severity_summary", {}),
+                "comparison": comparison,
+                "elapsed_s": round(time.monotonic() - started, 2),
+            })
+
+    counts = {}
+
+    def writer():
+        while (record := out_q.get()) is not _DONE:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            counts[record["status"]] = counts.get(record["status"], 0) + 1
+
+    def start(target, n, *args):
+        threads = [threading.Thread(target=target, args=args, daemon=True) for _ in range(n)]
+        for t in threads:
+            t.start()
+        return threads
+
+    def finish(threads, downstream: queue.Queue, n_downstream: int):
+        for t in threads:
+            t.join()
+        for _ in range(n_downstream):
+            downstream.put(_DONE)
+
+    with ProcessPoolExecutor(max_workers=parse_workers) as pool:
+        writer_thread = start(writer, 1)
+        ctgov_threads = start(ctgov_stage, net_workers)
+        parse_threads = start(parse_stage, parse_workers, pool)
+        edgar_threads = start(edgar_stage, net_workers)
+
+        finish(edgar_threads, filing_q, parse_workers)
+        finish(parse_threads, candidate_q, net_workers)
+        finish(ctgov_threads, out_q, 1)
+        finish(writer_thread, out_q, 0)
+
+    return counts
+
+
+# ── CLI ───────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Batch S-1 vs ClinicalTrials.gov screening for a list of tickers"
+    )
+    parser.add_argument("--tickers", required=True, help="File with one ticker per line")
+    parser.add_argument("--output", default=None, help="JSONL output path (default: stdout)")
+    parser.add_argument("--work-dir", default=".",
+                        help="Directory for per-ticker S-1 and CTgov outputs (default: .)")
+    parser.add_argument("--net-workers", type=int, default=NET_WORKERS,
+                        help=f"Threads per network stage (default: {NET_WORKERS})")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="Parser processes (default: CPU count)")
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE,
+                        help=f"Capacity of each inter-stage queue (default: {QUEUE_SIZE})")
+    parser.add_argument("--max-results", type=int, default=50,
+                        help="Maximum CTgov studies per candidate (default: 50)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the s1_parser parse cache")
+    args = parser.parse_args()
+
+    tickers = _read_tickers(args.tickers)
+    if not tickers:
+        raise SystemExit(f"No tickers in {args.tickers}")
+    os.makedirs(args.work_dir, exist_ok=True)
+
+    started = time.monotonic()
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        counts = run_batch(
+            tickers, args.work_dir, out,
+            net_workers=args.net_workers,
+            parse_workers=args.parse_workers,
+            queue_size=args.queue_size,
+            max_results=args.max_results,
+            use_cache=not args.no_cache,
+        )
+    finally:
+        if args.output:
+            out.close()
+
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items())) or "no records"
+    print(f"Batch complete: {len(tickers)} tickers, {summary} "
+          f"in {time.monotonic() - started:.1f} s", file=sys.stderr)
+    edgar_fetch.EDGAR_CLIENT.print_stats()
+    ctgov_fetch.CTGOV_CLIENT.print_stats()
+
+
+if __name__ == "__main__":
+    main()
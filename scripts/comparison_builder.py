@@ -11,13 +11,26 @@ Usage:
         --candidate izokibep \
         --ctgov-dir /tmp/ctgov_fetchall/ctgov_izokibep \
         --output /tmp/comparison_izokibep.json
+
+    # Every candidate in one report; ctgov-root is the fetch-all --output-dir
+    python scripts/comparison_builder.py --s1-json /tmp/s1_full.json \
+        --all-candidates --ctgov-root /tmp/ctgov_fetchall --output /tmp/comparison_all.json
+
+    # Spread the per-study checks over 8 processes (same output)
+    python scripts/comparison_builder.py --s1-json /tmp/s1_full.json \
+        --candidate izokibep --ctgov-dir /tmp/ctgov_fetchall/ctgov_izokibep --workers 8
 """
 
 import argparse
+import bisect
 import json
+import multiprocessing
 import os
 import re
 import sys
+from datetime import datetime
+
+from study_store import get_store
 
 
 # ── Phase Normalization ──────────────────────────────────────────────
@@ -98,6 +111,27 @@ def _base_phase(phase_str: str) -> int:
 
 # ── Study Matching ───────────────────────────────────────────────────
 
+# Known condition patterns to extract, most specific first
+CONDITION_PATTERNS = [
+    ("hidradenitis suppurativa", "Hidradenitis Suppurativa"),
+    ("psoriatic arthritis", "Psoriatic Arthritis"),
+    ("rheumatoid arthritis", "Rheumatoid Arthritis"),
+    ("ankylosing spondylitis", "Ankylosing Spondylitis"),
+    ("axial spondyloarthritis", "Axial Spondyloarthritis"),
+    ("thyroid eye disease", "Thyroid Eye Disease"),
+    ("chronic urticaria", "Chronic Urticaria"),
+    ("non-infectious uveitis", "Non-infectious Uveitis"),
+    ("non-anterior uveitis", "Non-anterior Uveitis"),
+    ("uveitis", "Uveitis"),
+    ("crohn", "Crohn's Disease"),
+    ("ulcerative colitis", "Ulcerative Colitis"),
+    ("psoriasis", "Psoriasis"),
+    ("lupus", "Lupus"),
+    ("multiple sclerosis", "Multiple Sclerosis"),
+    ("atopic dermatitis", "Atopic Dermatitis"),
+]
+
+
 def _get_study_indication(study: dict) -> str:
     """Extract the primary indication/condition from a CTgov study.
 
@@ -113,27 +147,7 @@ def _get_study_indication(study: dict) -> str:
     # Try conditions from title first (usually most specific)
     combined = f"{title} {brief}".lower()
 
-    # Known condition patterns to extract
-    condition_patterns = [
-        ("hidradenitis suppurativa", "Hidradenitis Suppurativa"),
-        ("psoriatic arthritis", "Psoriatic Arthritis"),
-        ("rheumatoid arthritis", "Rheumatoid Arthritis"),
-        ("ankylosing spondylitis", "Ankylosing Spondylitis"),
-        ("axial spondyloarthritis", "Axial Spondyloarthritis"),
-        ("thyroid eye disease", "Thyroid Eye Disease"),
-        ("chronic urticaria", "Chronic Urticaria"),
-        ("non-infectious uveitis", "Non-infectious Uveitis"),
-        ("non-anterior uveitis", "Non-anterior Uveitis"),
-        ("uveitis", "Uveitis"),
-        ("crohn", "Crohn's Disease"),
-        ("ulcerative colitis", "Ulcerative Colitis"),
-        ("psoriasis", "Psoriasis"),
-        ("lupus", "Lupus"),
-        ("multiple sclerosis", "Multiple Sclerosis"),
-        ("atopic dermatitis", "Atopic Dermatitis"),
-    ]
-
-    for pattern, label in condition_patterns:
+    for pattern, label in CONDITION_PATTERNS:
         if pattern in combined:
             return label
 
@@ -183,6 +197,215 @@ def _match_study_to_s1_indication(
     return None
 
 
+# ── Study Features ───────────────────────────────────────────────────
+
+# Bump whenever a change to _endpoint_key_terms, CONDITION_PATTERNS,
+# COMPLETION_DATE_FORMATS or study_features alters their output, so stored
+# features are recomputed.
+STUDY_FEATURES_VERSION = 1
+COMPLETION_DATE_FORMATS = ("%B %Y", "%B %d, %Y", "%Y-%m-%d")
+
+
+def _endpoint_key_terms(measure: str) -> list[str]:
+    """First three words of 4+ characters in an outcome measure, lowercased."""
+    key_terms = [t for t in re.findall(r"\b\w{4,}\b", measure.lower())
+                 if t not in ("with", "from", "that", "this", "were", "been")]
+    return key_terms[:3]
+
+
+def _parse_ctgov_date(date_str: str) -> str:
+    """ISO date for a CTgov date string, or "" if no known format fits."""
+    for fmt in COMPLETION_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).date().isoformat()
+        except ValueError:
+            pass
+    return ""
+
+
+def study_features(study: dict) -> dict:
+    """Derived fields of a structured CTgov study used by the comparisons.
+
+    Computed once per study: ctgov_fetch stores them in the structured
+    record under "features", and ``_features`` fills them in for records
+    fetched before they existed.
+    """
+    canonical = _ctgov_phases_to_canonical(study.get("design", {}).get("phases", []))
+    status = study.get("status", {})
+    return {
+        "version": STUDY_FEATURES_VERSION,
+        "canonical_phases": sorted(canonical),
+        "base_phases": sorted({_base_phase(p) for p in canonical}),
+        "start_date_iso": _parse_ctgov_date(status.get("start_date", "")),
+        "completion_date_iso": _parse_ctgov_date(status.get("completion_date", "")),
+        "primary_key_terms": [
+            _endpoint_key_terms(o.get("measure", "")) for o in study.get("primary_outcomes", [])
+        ],
+        "secondary_key_terms": [
+            _endpoint_key_terms(o.get("measure", "")) for o in study.get("secondary_outcomes", [])
+        ],
+        "indication": _get_study_indication(study),
+    }
+
+
+def _features(study: dict) -> dict:
+    """The study's precomputed features, computing and memoizing them on
+    the record if they are missing or from an older version."""
+    features = study.get("features")
+    if not features or features.get("version") != STUDY_FEATURES_VERSION:
+        features = study["features"] = study_features(study)
+    return features
+
+
+# ── Candidate Context ────────────────────────────────────────────────
+
+ENROLLMENT_RE = re.compile(
+    r"(?:enroll|randomiz|recruit)\w*\s+(?:approximately\s+)?(\d[\d,]*)\s+(?:patients?|subjects?|participants?|individuals?)",
+    re.IGNORECASE,
+)
+EFFICACY_RE = re.compile(
+    r"(?:response\s+rate|ORR|overall\s+response|progression.free"
+    r"|PFS|overall\s+survival|OS\b|complete\s+remission|CR\b"
+    r"|partial\s+response|PR\b|duration\s+of\s+response|DOR"
+    r"|event.free\s+survival|EFS|disease.free|DFS"
+    r"|(?:met|achieved|demonstrated).*?(?:endpoint|primary))",
+    re.IGNORECASE
+)
+NEGATIVE_STATUS_TERMS = ("terminat", "withdraw", "suspend", "discontinu", "halt")
+HEADLINE_SECTIONS = ("summary", "business")
+PRIMARY_MENTION_RE = re.compile(r"primary\s+(?:endpoint|outcome|measure)")
+SENTENCE_END_RE = re.compile(r"[.!?]\s+")
+PROMOTION_WINDOW = 200  # max characters between an endpoint term and a "primary endpoint" mention
+PROMOTION_SAME_SENTENCE = False  # also require the term and mention to share a sentence
+# Words of the mention itself; as endpoint key terms they would match the mention
+PROMOTION_ANCHOR_TERMS = {
+    "primary", "endpoint", "endpoints", "outcome", "outcomes", "measure", "measures",
+}
+
+
+class CandidateContext:
+    """S-1 text features of one candidate, derived once and shared by every
+    per-study check.
+
+    Attributes:
+        passages       the candidate's passages from find_candidates
+        text           passage texts joined with spaces
+        text_lower     ``text`` lowercased
+        tokens         set of lowercase word tokens in ``text``
+        term_offsets   token → sorted offsets of its occurrences in ``text_lower``
+        primary_mentions  sorted offsets of "primary endpoint/outcome/measure"
+        primary_mention_ends  end offset of each mention in ``primary_mentions``
+        enrollment_mentions  patient counts next to enroll/randomiz/recruit
+        double_blind, open_label, randomized, negative_status_disclosed,
+        missed_endpoint_disclosed   keyword mentions anywhere in the text
+        headline_passage  first efficacy mention, preferring summary and
+                          business sections (None if there is none)
+    """
+
+    def __init__(self, candidate: dict):
+        self.passages = candidate.get("passages", [])
+        self.text = " ".join(p.get("text", "") for p in self.passages)
+        self.text_lower = self.text.lower()
+        self.term_offsets = {}
+        for m in re.finditer(r"\w+", self.text_lower):
+            self.term_offsets.setdefault(m.group(), []).append(m.start())
+        self.tokens = set(self.term_offsets)
+        mentions = list(PRIMARY_MENTION_RE.finditer(self.text_lower))
+        self.primary_mentions = [m.start() for m in mentions]
+        self.primary_mention_ends = [m.end() for m in mentions]
+
+        # Sentence start offsets; passage boundaries also end a sentence
+        starts = {0}
+        offset = 0
+        for p in self.passages:
+            starts.add(offset)
+            offset += len(p.get("text", "")) + 1
+        starts.update(m.end() for m in SENTENCE_END_RE.finditer(self.text_lower))
+        self._sentence_starts = sorted(starts)
+        self._line_starts = [0] + [m.end() for m in re.finditer(r"\n", self.text_lower)]
+        self._proximity_cache = {}
+
+        self.enrollment_mentions = []
+        for n in ENROLLMENT_RE.findall(self.text):
+            try:
+                self.enrollment_mentions.append(int(n.replace(",", "")))
+            except ValueError:
+                pass
+
+        text = self.text_lower
+        self.double_blind = "double-blind" in text or "double blind" in text
+        self.open_label = "open-label" in text or "open label" in text
+        self.randomized = "randomized" in text
+        self.negative_status_disclosed = any(term in text for term in NEGATIVE_STATUS_TERMS)
+        self.missed_endpoint_disclosed = (
+            "not statistically significant" in text or "did not meet" in text
+        )
+        self.headline_passage = self._find_headline_passage()
+
+    def _sentence_index(self, offset: int) -> int:
+        return bisect.bisect_right(self._sentence_starts, offset)
+
+    def near_primary_mention(
+        self, term: str, window: int = PROMOTION_WINDOW,
+        same_sentence: bool = PROMOTION_SAME_SENTENCE,
+    ) -> bool:
+        """Whether ``term`` occurs as a whole word within ``window`` characters
+        of a "primary endpoint/outcome/measure" mention, in the same sentence
+        if ``same_sentence``. Both must be on the same line of passage text,
+        and occurrences inside a mention do not count.
+
+        Walks the two sorted offset lists together, so each lookup is linear
+        in the number of occurrences; answers are cached per candidate.
+
+        >>> ctx = CandidateContext({"passages": [{"text": "The primary outcome was met."}]})
+        >>> ctx.near_primary_mention("outcome"), ctx.near_primary_mention("primary")
+        (False, False)
+        >>> ctx = CandidateContext({"passages": [{"text":
+        ...     "The primary outcome was met. Overall response rate was 40%."}]})
+        >>> ctx.near_primary_mention("response")
+        True
+        """
+        key = (term, window, same_sentence)
+        if key not in self._proximity_cache:
+            offsets = [o for o in self.term_offsets.get(term, []) if not self._in_mention(o)]
+            self._proximity_cache[key] = self._near(
+                offsets, self.primary_mentions, window, same_sentence,
+            )
+        return self._proximity_cache[key]
+
+    def _in_mention(self, offset: int) -> bool:
+        i = bisect.bisect_right(self.primary_mentions, offset) - 1
+        return i >= 0 and offset < self.primary_mention_ends[i]
+
+    def _near(self, offsets: list[int], anchors: list[int], window: int, same_sentence: bool) -> bool:
+        # A qualifying pair implies a qualifying pair that is adjacent in the
+        # merged order, and the merge compares every adjacent pair.
+        i = j = 0
+        while i < len(offsets) and j < len(anchors):
+            a, b = offsets[i], anchors[j]
+            if (
+                abs(a - b) <= window
+                and bisect.bisect_right(self._line_starts, a) == bisect.bisect_right(self._line_starts, b)
+                and (not same_sentence or self._sentence_index(a) == self._sentence_index(b))
+            ):
+                return True
+            if a < b:
+                i += 1
+            else:
+                j += 1
+        return False
+
+    def _find_headline_passage(self) -> dict | None:
+        for p in self.passages:
+            if p.get("section_class", "unknown") in HEADLINE_SECTIONS:
+                if EFFICACY_RE.search(p.get("text", "")):
+                    return p
+        for p in self.passages:
+            if EFFICACY_RE.search(p.get("text", "")):
+                return p
+        return None
+
+
 # ── Comparison Logic ─────────────────────────────────────────────────
 
 def _compare_phase(s1_phase_claims: list[str], ctgov_study: dict) -> dict:
@@ -193,7 +416,8 @@ def _compare_phase(s1_phase_claims: list[str], ctgov_study: dict) -> dict:
     passages that reference this specific study/indication.
     """
     ctgov_phases_raw = ctgov_study.get("design", {}).get("phases", [])
-    ctgov_canonical = _ctgov_phases_to_canonical(ctgov_phases_raw)
+    features = _features(ctgov_study)
+    ctgov_canonical = features["canonical_phases"]
 
     # Collect all S-1 phases into canonical form
     s1_canonical = set()
@@ -203,12 +427,12 @@ def _compare_phase(s1_phase_claims: list[str], ctgov_study: dict) -> dict:
     issues = []
 
     # Get the highest phase CTgov registers
-    ctgov_max = max((_base_phase(p) for p in ctgov_canonical), default=0)
+    ctgov_max = max(features["base_phases"], default=0)
 
     # Only flag phase inflation if the CTgov study's registered phase is
     # not present at all in the S-1's claims (the S-1 may legitimately
     # reference multiple phases for the same drug across indications)
-    ctgov_phase_numbers = {_base_phase(p) for p in ctgov_canonical}
+    ctgov_phase_numbers = set(features["base_phases"])
     s1_phase_numbers = {_base_phase(p) for p in s1_canonical}
 
     # Flag if S-1 never mentions the actual phase this study is registered as
@@ -241,12 +465,12 @@ def _compare_phase(s1_phase_claims: list[str], ctgov_study: dict) -> dict:
         "s1_phase_claims": s1_phase_claims,
         "ctgov_phases": ctgov_phases_raw,
         "s1_canonical": sorted(s1_canonical),
-        "ctgov_canonical": sorted(ctgov_canonical),
+        "ctgov_canonical": list(ctgov_canonical),
         "issues": issues,
     }
 
 
-def _compare_status(s1_passages: list[dict], ctgov_study: dict) -> dict:
+def _compare_status(ctx: CandidateContext, ctgov_study: dict) -> dict:
     """Check CTgov trial status against what the S-1 implies."""
     status = ctgov_study.get("status", {})
     overall = status.get("overall_status", "UNKNOWN")
@@ -257,12 +481,7 @@ def _compare_status(s1_passages: list[dict], ctgov_study: dict) -> dict:
     negative_statuses = {"TERMINATED", "WITHDRAWN", "SUSPENDED"}
     if overall in negative_statuses:
         # Check if S-1 discloses the negative status
-        s1_text = " ".join(p.get("text", "") for p in s1_passages).lower()
-        disclosed = any(
-            term in s1_text
-            for term in ["terminat", "withdraw", "suspend", "discontinu", "halt"]
-        )
-        if not disclosed:
+        if not ctx.negative_status_disclosed:
             issues.append({
                 "type": "undisclosed_negative_status",
                 "severity": "high",
@@ -290,24 +509,14 @@ def _compare_status(s1_passages: list[dict], ctgov_study: dict) -> dict:
     }
 
 
-def _compare_enrollment(s1_passages: list[dict], ctgov_study: dict) -> dict:
+def _compare_enrollment(ctx: CandidateContext, ctgov_study: dict) -> dict:
     """Compare enrollment figures."""
     design = ctgov_study.get("design", {})
     ctgov_enrollment = design.get("enrollment_count")
     ctgov_type = design.get("enrollment_type", "")
 
-    # Try to find enrollment numbers in S-1 passages
-    s1_text = " ".join(p.get("text", "") for p in s1_passages)
-    s1_enrollment_mentions = re.findall(
-        r"(?:enroll|randomiz|recruit)\w*\s+(?:approximately\s+)?(\d[\d,]*)\s+(?:patients?|subjects?|participants?|individuals?)",
-        s1_text, re.IGNORECASE,
-    )
-    s1_numbers = []
-    for n in s1_enrollment_mentions:
-        try:
-            s1_numbers.append(int(n.replace(",", "")))
-        except ValueError:
-            pass
+    # Enrollment numbers found in S-1 passages
+    s1_numbers = list(ctx.enrollment_mentions)
 
     issues = []
     if ctgov_enrollment and s1_numbers:
@@ -331,18 +540,17 @@ def _compare_enrollment(s1_passages: list[dict], ctgov_study: dict) -> dict:
     }
 
 
-def _compare_design(s1_passages: list[dict], ctgov_study: dict) -> dict:
+def _compare_design(ctx: CandidateContext, ctgov_study: dict) -> dict:
     """Compare study design details (blinding, randomization, arms)."""
     design = ctgov_study.get("design", {})
     arms = ctgov_study.get("arms_interventions", {}).get("arm_groups", [])
 
-    s1_text = " ".join(p.get("text", "") for p in s1_passages).lower()
     issues = []
 
     # Check blinding claims
     ctgov_masking = design.get("masking", "").upper()
     if ctgov_masking == "NONE" or ctgov_masking == "":
-        if "double-blind" in s1_text or "double blind" in s1_text:
+        if ctx.double_blind:
             issues.append({
                 "type": "blinding_mismatch",
                 "severity": "high",
@@ -351,7 +559,7 @@ def _compare_design(s1_passages: list[dict], ctgov_study: dict) -> dict:
                     f"shows masking as '{ctgov_masking or 'NONE/OPEN'}'."
                 ),
             })
-    if "open-label" in s1_text or "open label" in s1_text:
+    if ctx.open_label:
         if ctgov_masking in ("DOUBLE", "TRIPLE", "QUADRUPLE"):
             issues.append({
                 "type": "blinding_mismatch",
@@ -364,7 +572,7 @@ def _compare_design(s1_passages: list[dict], ctgov_study: dict) -> dict:
 
     # Check randomization
     ctgov_allocation = design.get("allocation", "").upper()
-    if "randomized" in s1_text and ctgov_allocation == "NON_RANDOMIZED":
+    if ctx.randomized and ctgov_allocation == "NON_RANDOMIZED":
         issues.append({
             "type": "randomization_mismatch",
             "severity": "medium",
@@ -382,29 +590,21 @@ def _compare_design(s1_passages: list[dict], ctgov_study: dict) -> dict:
     }
 
 
-def _compare_endpoints(s1_passages: list[dict], ctgov_study: dict) -> dict:
+def _compare_endpoints(ctx: CandidateContext, ctgov_study: dict) -> dict:
     """Compare primary/secondary endpoints."""
     primary = ctgov_study.get("primary_outcomes", [])
     secondary = ctgov_study.get("secondary_outcomes", [])
 
-    s1_text = " ".join(p.get("text", "") for p in s1_passages).lower()
     issues = []
 
     # Check if S-1 cites a secondary endpoint as if it were primary
-    for so in secondary:
-        measure = so.get("measure", "").lower()
-        # Extract key terms from the endpoint
-        key_terms = [t for t in re.findall(r"\b\w{4,}\b", measure)
-                     if t not in ("with", "from", "that", "this", "were", "been")]
-        # Check if S-1 references this endpoint as "primary"
-        for term in key_terms[:3]:
-            # Look for the term near "primary" in S-1
-            pattern = re.compile(
-                rf"primary\s+(?:endpoint|outcome|measure).*?\b{re.escape(term)}\b"
-                rf"|\b{re.escape(term)}\b.*?primary\s+(?:endpoint|outcome|measure)",
-                re.IGNORECASE,
-            )
-            if pattern.search(s1_text):
+    for so, key_terms in zip(secondary, _features(ctgov_study)["secondary_key_terms"]):
+        # Check if S-1 references this endpoint as "primary": one of its
+        # key terms near a "primary endpoint" mention
+        for term in key_terms:
+            if term in PROMOTION_ANCHOR_TERMS:
+                continue
+            if ctx.near_primary_mention(term):
                 issues.append({
                     "type": "endpoint_promotion",
                     "severity": "high",
@@ -434,8 +634,6 @@ def _check_fdaaa_801(ctgov_study: dict) -> dict:
     If a trial is COMPLETED and has no results posted, check if it is
     past the 12-month statutory deadline for results reporting.
     """
-    from datetime import datetime
-
     status = ctgov_study.get("status", {})
     overall = status.get("overall_status", "UNKNOWN")
     has_results = ctgov_study.get("has_results", False)
@@ -443,113 +641,64 @@ def _check_fdaaa_801(ctgov_study: dict) -> dict:
 
     if overall == "COMPLETED" and not has_results:
         completion_str = status.get("completion_date", "")
-        if completion_str:
-            comp_date = None
-            for fmt in ("%B %Y", "%B %d, %Y", "%Y-%m-%d"):
-                try:
-                    comp_date = datetime.strptime(completion_str, fmt)
-                    break
-                except ValueError:
-                    pass
-            if comp_date:
-                months_since = (datetime.now() - comp_date).days / 30.44
-                if months_since > 12:
-                    issues.append({
-                        "type": "fdaaa_801_noncompliance",
-                        "severity": "high",
-                        "detail": (
-                            f"Trial completed on {completion_str} "
-                            f"(~{int(months_since)} months ago) but no "
-                            f"results posted on ClinicalTrials.gov. "
-                            f"FDAAA 801 requires results within 12 months."
-                        ),
-                    })
-                else:
-                    issues.append({
-                        "type": "fdaaa_801_window",
-                        "severity": "low",
-                        "detail": (
-                            f"Trial completed on {completion_str} "
-                            f"(~{int(months_since)} months ago). Within "
-                            f"12-month FDAAA 801 window, but results not "
-                            f"yet posted."
-                        ),
-                    })
+        completion_iso = _features(ctgov_study)["completion_date_iso"]
+        if completion_iso:
+            comp_date = datetime.fromisoformat(completion_iso)
+            months_since = (datetime.now() - comp_date).days / 30.44
+            if months_since > 12:
+                issues.append({
+                    "type": "fdaaa_801_noncompliance",
+                    "severity": "high",
+                    "detail": (
+                        f"Trial completed on {completion_str} "
+                        f"(~{int(months_since)} months ago) but no "
+                        f"results posted on ClinicalTrials.gov. "
+                        f"FDAAA 801 requires results within 12 months."
+                    ),
+                })
+            else:
+                issues.append({
+                    "type": "fdaaa_801_window",
+                    "severity": "low",
+                    "detail": (
+                        f"Trial completed on {completion_str} "
+                        f"(~{int(months_since)} months ago). Within "
+                        f"12-month FDAAA 801 window, but results not "
+                        f"yet posted."
+                    ),
+                })
 
     return {"issues": issues}
 
 
-def _check_endpoint_hierarchy(s1_passages: list[dict], ctgov_study: dict) -> dict:
+def _check_endpoint_hierarchy(ctx: CandidateContext, ctgov_study: dict) -> dict:
     """Detect the Harkonen pattern: leading with secondary while burying primary.
 
     Identifies the S-1 headline finding (first efficacy mention in
     summary/business sections) and checks whether it comes from
     the primary endpoint.
     """
-    primary = ctgov_study.get("primary_outcomes", [])
-    secondary = ctgov_study.get("secondary_outcomes", [])
-    s1_text = " ".join(p.get("text", "") for p in s1_passages).lower()
+    features = _features(ctgov_study)
+    primary_terms = [t for terms in features["primary_key_terms"] for t in terms]
+    secondary_terms = [t for terms in features["secondary_key_terms"] for t in terms]
     issues = []
 
-    if not primary:
+    if not ctgov_study.get("primary_outcomes", []):
         return {"headline_finding": None, "issues": issues}
 
-    # Find the first efficacy result mentioned (the "headline")
-    # Prioritize passages from summary or business sections
-    headline_passage = None
-    efficacy_pattern = re.compile(
-        r"(?:response\s+rate|ORR|overall\s+response|progression.free"
-        r"|PFS|overall\s+survival|OS\b|complete\s+remission|CR\b"
-        r"|partial\s+response|PR\b|duration\s+of\s+response|DOR"
-        r"|event.free\s+survival|EFS|disease.free|DFS"
-        r"|(?:met|achieved|demonstrated).*?(?:endpoint|primary))",
-        re.IGNORECASE
-    )
-    priority_sections = ("summary", "business")
-    for p in s1_passages:
-        sec_class = p.get("section_class", "unknown")
-        if sec_class in priority_sections:
-            if efficacy_pattern.search(p.get("text", "")):
-                headline_passage = p
-                break
-    if not headline_passage:
-        for p in s1_passages:
-            if efficacy_pattern.search(p.get("text", "")):
-                headline_passage = p
-                break
-
+    # The first efficacy result mentioned (the "headline"), preferring
+    # passages from summary or business sections
+    headline_passage = ctx.headline_passage
     if not headline_passage:
         return {"headline_finding": None, "issues": issues}
 
     # Check if headline is about a secondary endpoint
     headline_text = headline_passage.get("text", "").lower()
-    primary_mentioned_in_headline = False
-    for pe in primary:
-        measure = pe.get("measure", "").lower()
-        key_terms = [t for t in re.findall(r"\b\w{4,}\b", measure)
-                     if t not in ("with", "from", "that", "this", "were", "been")]
-        if any(t in headline_text for t in key_terms[:3]):
-            primary_mentioned_in_headline = True
-            break
-
-    secondary_mentioned_in_headline = False
-    for se in secondary:
-        measure = se.get("measure", "").lower()
-        key_terms = [t for t in re.findall(r"\b\w{4,}\b", measure)
-                     if t not in ("with", "from", "that", "this", "were", "been")]
-        if any(t in headline_text for t in key_terms[:3]):
-            secondary_mentioned_in_headline = True
-            break
+    primary_mentioned_in_headline = any(t in headline_text for t in primary_terms)
+    secondary_mentioned_in_headline = any(t in headline_text for t in secondary_terms)
 
     # Check if primary endpoint is discussed anywhere
-    primary_discussed = False
-    for pe in primary:
-        measure = pe.get("measure", "").lower()
-        key_terms = [t for t in re.findall(r"\b\w{4,}\b", measure)
-                     if t not in ("with", "from", "that", "this", "were", "been")]
-        if any(t in s1_text for t in key_terms[:3]):
-            primary_discussed = True
-            break
+    primary_discussed = any(t in ctx.text_lower for t in primary_terms)
 
     # Harkonen pattern: headline from secondary, primary not discussed or failed
     if secondary_mentioned_in_headline and not primary_mentioned_in_headline:
@@ -625,7 +774,7 @@ def format_element_status(element: str, ctgov_value: str, s1_value: str, status:
         return f"  {icon}  {element}: {ctgov_value} (S-1: not found)"
 
 
-def _compare_results(s1_passages: list[dict], ctgov_study: dict) -> dict:
+def _compare_results(ctx: CandidateContext, ctgov_study: dict) -> dict:
     """Compare posted results against S-1 claims."""
     if not ctgov_study.get("has_results"):
         return {"has_results": False, "issues": []}
@@ -634,7 +783,6 @@ def _compare_results(s1_passages: list[dict], ctgov_study: dict) -> dict:
     outcome_measures = results.get("outcome_measures", [])
     adverse_events = results.get("adverse_events", {})
 
-    s1_text = " ".join(p.get("text", "") for p in s1_passages).lower()
     issues = []
 
     # Check primary outcomes for statistical significance
@@ -654,7 +802,7 @@ def _compare_results(s1_passages: list[dict], ctgov_study: dict) -> dict:
             if p_val > 0.05:
                 # Primary endpoint missed significance
                 # Check if S-1 discloses this
-                if "not statistically significant" not in s1_text and "did not meet" not in s1_text:
+                if not ctx.missed_endpoint_disclosed:
                     issues.append({
                         "type": "undisclosed_missed_endpoint",
                         "severity": "high",
@@ -701,7 +849,7 @@ def _compare_results(s1_passages: list[dict], ctgov_study: dict) -> dict:
             # Check if S-1 mentions adverse events at all
             ae_terms_in_s1 = sum(
                 1 for sae in notable_saes
-                if sae["term"].lower() in s1_text
+                if sae["term"].lower() in ctx.text_lower
             )
             total_saes = len(notable_saes)
             if ae_terms_in_s1 < total_saes * 0.3 and total_saes > 2:
@@ -814,10 +962,141 @@ def _check_s1_flags(candidate_data: dict) -> list[dict]:
 
 # ── Main Comparison ──────────────────────────────────────────────────
 
+COMPARE_CHUNKSIZE = 4  # studies handed to a worker at a time
+
+
+def _load_structured_study(study_info: dict) -> dict | None:
+    """Structured record for a manifest entry, from the shared study store
+    or, for older manifests and JSON exports, the entry's structured_file."""
+    store_path = study_info.get("store")
+    if store_path and os.path.exists(store_path):
+        study = get_store(store_path).get_structured(study_info["nct_id"])
+        if study is not None:
+            return study
+    structured_path = study_info.get("structured_file", "")
+    if not os.path.exists(structured_path):
+        return None
+    with open(structured_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _compare_study(candidate: dict, ctx: CandidateContext, study: dict) -> tuple[dict, list[dict]]:
+    """Run every per-study check for one CTgov study.
+
+    Returns the study's comparison entry and its issues, tagged with the
+    NCT ID and color code.
+    """
+    nct_id = study.get("identification", {}).get("nct_id", "")
+    title = study.get("identification", {}).get("brief_title", "")
+    study_indication = _features(study)["indication"]
+    matched_indication = _match_study_to_s1_indication(
+        study_indication, candidate.get("indications", [])
+    )
+
+    # Run comparisons
+    phase_cmp = _compare_phase(candidate.get("phase_claims", []), study)
+    status_cmp = _compare_status(ctx, study)
+    enrollment_cmp = _compare_enrollment(ctx, study)
+    design_cmp = _compare_design(ctx, study)
+    endpoint_cmp = _compare_endpoints(ctx, study)
+    results_cmp = _compare_results(ctx, study)
+    fdaaa_cmp = _check_fdaaa_801(study)
+    hierarchy_cmp = _check_endpoint_hierarchy(ctx, study)
+
+    # Collect issues from this study
+    study_issues = []
+    for cmp in [phase_cmp, status_cmp, enrollment_cmp, design_cmp,
+                 endpoint_cmp, results_cmp, fdaaa_cmp, hierarchy_cmp]:
+        study_issues.extend(cmp.get("issues", []))
+
+    # Tag each issue with the NCT ID and color code
+    for issue in study_issues:
+        issue["nct_id"] = nct_id
+        issue["color"] = _color_code_element(issue.get("severity", ""))
+
+    # Build color-coded design comparison table
+    design_table = []
+    for label, cmp_data, element in [
+        ("Phase", phase_cmp, "ctgov_phases"),
+        ("Status", status_cmp, "ctgov_status"),
+        ("Enrollment", enrollment_cmp, "ctgov_enrollment"),
+        ("Masking", design_cmp, "ctgov_masking"),
+        ("Allocation", design_cmp, "ctgov_allocation"),
+    ]:
+        ctgov_val = cmp_data.get(element, "")
+        has_issues = any(i.get("severity") in ("high", "medium")
+                         for i in cmp_data.get("issues", []))
+        status_str = "MISMATCH" if has_issues else "MATCH"
+        design_table.append({
+            "element": label,
+            "ctgov_value": str(ctgov_val),
+            "status": status_str,
+            "color": _color_code_element(status_str),
+        })
+
+    comparison = {
+        "nct_id": nct_id,
+        "brief_title": title,
+        "study_indication": study_indication,
+        "matched_s1_indication": matched_indication,
+        "sponsor": study.get("sponsor", {}).get("name", ""),
+        "phase": phase_cmp,
+        "status": status_cmp,
+        "enrollment": enrollment_cmp,
+        "design": design_cmp,
+        "endpoints": endpoint_cmp,
+        "results": results_cmp,
+        "fdaaa_801": fdaaa_cmp,
+        "endpoint_hierarchy": hierarchy_cmp,
+        "design_comparison_table": design_table,
+        "issue_count": len(study_issues),
+    }
+    return comparison, study_issues
+
+
+_WORKER_CONTEXT = None  # (candidate, CandidateContext), set by _compare_worker_init
+
+
+def _compare_worker_init(candidate: dict):
+    """Pool initializer: build the candidate context once per worker."""
+    global _WORKER_CONTEXT
+    _WORKER_CONTEXT = (candidate, CandidateContext(candidate))
+
+
+def _compare_task(study: dict) -> tuple[dict, list[dict]]:
+    candidate, ctx = _WORKER_CONTEXT
+    return _compare_study(candidate, ctx, study)
+
+
+def _load_studies(manifest: dict, study_cache: dict = None) -> list[dict]:
+    """Structured records for a manifest's studies, with features computed.
+
+    ``study_cache`` (NCT ID → record) lets several manifests share records,
+    so a study referenced by more than one candidate is loaded and
+    feature-extracted once.
+    """
+    studies = []
+    for study_info in manifest.get("studies", []):
+        nct_id = study_info.get("nct_id", "")
+        study = study_cache.get(nct_id) if study_cache is not None else None
+        if study is None:
+            study = _load_structured_study(study_info)
+            if study is None:
+                continue
+            # Computed here so pool workers receive them with the record
+            _features(study)
+            if study_cache is not None and nct_id:
+                study_cache[nct_id] = study
+        studies.append(study)
+    return studies
+
+
 def build_comparison(
     s1_data: dict,
     candidate_name: str,
     ctgov_dir: str,
+    workers: int = 1,
+    study_cache: dict = None,
 ) -> dict:
     """Build full comparison between S-1 candidate and CTgov studies.
 
@@ -825,6 +1104,11 @@ def build_comparison(
         s1_data: Full output from s1_parser.py find_candidates action.
         candidate_name: Name of the candidate to compare (e.g. "izokibep").
         ctgov_dir: Directory containing CTgov structured JSONs and manifest.
+        workers: Processes to spread the per-study checks over; each builds
+            the candidate context once. The result is identical to the
+            sequential run.
+        study_cache: Optional NCT ID → structured record cache shared
+            across calls (see ``build_all_comparisons``).
 
     Returns:
         Structured comparison dict with per-study comparisons and summary.
@@ -846,93 +1130,28 @@ def build_comparison(
     with open(manifest_path, "r", encoding="utf-8") as f:
         manifest = json.load(f)
 
-    # Load all structured study files
-    studies = []
-    for study_info in manifest.get("studies", []):
-        structured_path = study_info.get("structured_file", "")
-        if not os.path.exists(structured_path):
-            continue
-        with open(structured_path, "r", encoding="utf-8") as f:
-            studies.append(json.load(f))
+    # Load all structured study records
+    studies = _load_studies(manifest, study_cache)
 
     if not studies:
         return {"error": "No structured study files found."}
 
-    # Get S-1 passages for this candidate
-    s1_passages = candidate.get("passages", [])
+    # Compare each study, in manifest order. The candidate's S-1 text
+    # features are derived once (per worker) and shared by every study.
+    if workers > 1 and len(studies) > 1:
+        with multiprocessing.Pool(min(workers, len(studies)), initializer=_compare_worker_init,
+                                  initargs=(candidate,)) as pool:
+            results = pool.map(_compare_task, studies, chunksize=COMPARE_CHUNKSIZE)
+    else:
+        ctx = CandidateContext(candidate)
+        results = [_compare_study(candidate, ctx, study) for study in studies]
 
-    # Compare each study
     study_comparisons = []
     all_issues = []
-
-    for study in studies:
-        nct_id = study.get("identification", {}).get("nct_id", "")
-        title = study.get("identification", {}).get("brief_title", "")
-        study_indication = _get_study_indication(study)
-        matched_indication = _match_study_to_s1_indication(
-            study_indication, candidate.get("indications", [])
-        )
-
-        # Run comparisons
-        phase_cmp = _compare_phase(candidate.get("phase_claims", []), study)
-        status_cmp = _compare_status(s1_passages, study)
-        enrollment_cmp = _compare_enrollment(s1_passages, study)
-        design_cmp = _compare_design(s1_passages, study)
-        endpoint_cmp = _compare_endpoints(s1_passages, study)
-        results_cmp = _compare_results(s1_passages, study)
-        fdaaa_cmp = _check_fdaaa_801(study)
-        hierarchy_cmp = _check_endpoint_hierarchy(s1_passages, study)
-
-        # Collect issues from this study
-        study_issues = []
-        for cmp in [phase_cmp, status_cmp, enrollment_cmp, design_cmp,
-                     endpoint_cmp, results_cmp, fdaaa_cmp, hierarchy_cmp]:
-            study_issues.extend(cmp.get("issues", []))
-
-        # Tag each issue with the NCT ID and color code
-        for issue in study_issues:
-            issue["nct_id"] = nct_id
-            issue["color"] = _color_code_element(issue.get("severity", ""))
+    for comparison, study_issues in results:
+        study_comparisons.append(comparison)
         all_issues.extend(study_issues)
 
-        # Build color-coded design comparison table
-        design_table = []
-        for label, cmp_data, element in [
-            ("Phase", phase_cmp, "ctgov_phases"),
-            ("Status", status_cmp, "ctgov_status"),
-            ("Enrollment", enrollment_cmp, "ctgov_enrollment"),
-            ("Masking", design_cmp, "ctgov_masking"),
-            ("Allocation", design_cmp, "ctgov_allocation"),
-        ]:
-            ctgov_val = cmp_data.get(element, "")
-            has_issues = any(i.get("severity") in ("high", "medium")
-                             for i in cmp_data.get("issues", []))
-            status_str = "MISMATCH" if has_issues else "MATCH"
-            design_table.append({
-                "element": label,
-                "ctgov_value": str(ctgov_val),
-                "status": status_str,
-                "color": _color_code_element(status_str),
-            })
-
-        study_comparisons.append({
-            "nct_id": nct_id,
-            "brief_title": title,
-            "study_indication": study_indication,
-            "matched_s1_indication": matched_indication,
-            "sponsor": study.get("sponsor", {}).get("name", ""),
-            "phase": phase_cmp,
-            "status": status_cmp,
-            "enrollment": enrollment_cmp,
-            "design": design_cmp,
-            "endpoints": endpoint_cmp,
-            "results": results_cmp,
-            "fdaaa_801": fdaaa_cmp,
-            "endpoint_hierarchy": hierarchy_cmp,
-            "design_comparison_table": design_table,
-            "issue_count": len(study_issues),
-        })
-
     # S-1 language flags (not tied to a specific study)
     s1_flags = _check_s1_flags(candidate)
     all_issues.extend(s1_flags)
@@ -970,6 +1189,61 @@ def build_comparison(
     }
 
 
+def _candidate_ctgov_dir(ctgov_root: str, candidate_name: str) -> str:
+    """The candidate's directory under a fetch-all --output-dir."""
+    return os.path.join(ctgov_root, f"ctgov_{candidate_name.replace(' ', '_').lower()}")
+
+
+def build_all_comparisons(
+    s1_data: dict,
+    ctgov_root: str,
+    candidate_names: list[str] = None,
+    workers: int = 1,
+) -> dict:
+    """Compare every S-1 candidate (or ``candidate_names``) in one pass.
+
+    Each candidate's studies are read from ``ctgov_root``/ctgov_<name>, the
+    layout ``ctgov_fetch.py fetch-all --output-dir ctgov_root`` writes.
+    Studies shared between candidates (combination trials, aliases) are
+    loaded and feature-extracted once.
+
+    Returns a combined report: per-candidate ``build_comparison`` results
+    keyed by candidate name, study counts, and a summed severity summary.
+    """
+    if candidate_names is None:
+        candidate_names = [c["name"] for c in s1_data.get("candidates", [])]
+
+    study_cache = {}
+    comparisons = {}
+    for name in candidate_names:
+        comparisons[name] = build_comparison(
+            s1_data, name, _candidate_ctgov_dir(ctgov_root, name),
+            workers=workers, study_cache=study_cache,
+        )
+
+    # NCT IDs compared for more than one candidate
+    seen = {}
+    for result in comparisons.values():
+        for sc in result.get("study_comparisons", []):
+            seen[sc["nct_id"]] = seen.get(sc["nct_id"], 0) + 1
+
+    severity = {"high": 0, "medium": 0, "low": 0, "info": 0, "total": 0}
+    for result in comparisons.values():
+        for level, count in result.get("severity_summary", {}).items():
+            severity[level] += count
+
+    return {
+        "comparisons": comparisons,
+        "summary": {
+            "candidates": len(comparisons),
+            "candidates_with_errors": sorted(n for n, r in comparisons.items() if "error" in r),
+            "studies_loaded": len(study_cache),
+            "studies_shared": sum(1 for n in seen.values() if n > 1),
+        },
+        "severity_summary": severity,
+    }
+
+
 # ── CLI ──────────────────────────────────────────────────────────────
 
 def main():
@@ -981,25 +1255,45 @@ def main():
         help="Path to S-1 parser JSON output (from find_candidates action)",
     )
     parser.add_argument(
-        "--candidate", required=True,
-        help="Candidate name to compare (e.g. 'izokibep')",
+        "--candidate", action="append", default=None,
+        help="Candidate name to compare (e.g. 'izokibep'); repeat for several",
     )
     parser.add_argument(
-        "--ctgov-dir", required=True,
-        help="Directory with CTgov structured JSONs and manifest.json",
+        "--ctgov-dir", default=None,
+        help="Directory with the CTgov manifest.json (from ctgov_fetch.py fetch-all)",
+    )
+    parser.add_argument(
+        "--all-candidates", action="store_true",
+        help="Compare every S-1 candidate (or each --candidate) into one combined report",
+    )
+    parser.add_argument(
+        "--ctgov-root", default=".",
+        help="With several candidates: the fetch-all --output-dir holding "
+             "ctgov_<candidate> directories (default: .)",
     )
     parser.add_argument(
         "--output", default=None,
         help="Output file path (default: stdout)",
     )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="Processes for the per-study checks (default: 1)",
+    )
     args = parser.parse_args()
 
+    multi = args.all_candidates or len(args.candidate or []) > 1
+    if not multi and not (args.candidate and args.ctgov_dir):
+        parser.error("--candidate and --ctgov-dir are required (or use --all-candidates)")
+
     # Load S-1 data
     with open(args.s1_json, "r", encoding="utf-8") as f:
         s1_data = json.load(f)
 
     # Build comparison
-    result = build_comparison(s1_data, args.candidate, args.ctgov_dir)
+    if multi:
+        result = build_all_comparisons(s1_data, args.ctgov_root, args.candidate, workers=args.workers)
+    else:
+        result = build_comparison(s1_data, args.candidate[0], args.ctgov_dir, workers=args.workers)
 
     # Output
     output_json = json.dumps(result, indent=2, ensure_ascii=False)
@@ -1008,8 +1302,16 @@ def main():
             f.write(output_json)
         # Print summary to stderr
         sev = result.get("severity_summary", {})
-        print(f"Comparison complete: {args.candidate}", file=sys.stderr)
-        print(f"  Studies compared: {len(result.get('study_comparisons', []))}", file=sys.stderr)
+        if multi:
+            summary = result["summary"]
+            print(f"Comparison complete: {summary['candidates']} candidates", file=sys.stderr)
+            print(f"  Studies loaded: {summary['studies_loaded']} "
+                  f"({summary['studies_shared']} shared between candidates)", file=sys.stderr)
+            for name in summary["candidates_with_errors"]:
+                print(f"  {name}: {result['comparisons'][name]['error']}", file=sys.stderr)
+        else:
+            print(f"Comparison complete: {args.candidate[0]}", file=sys.stderr)
+            print(f"  Studies compared: {len(result.get('study_comparisons', []))}", file=sys.stderr)
         print(f"  Issues: {sev.get('high',0)} high, {sev.get('medium',0)} medium, "
               f"{sev.get('low',0)} low, {sev.get('info',0)} info", file=sys.stderr)
         print(f"  Output: {args.output}", file=sys.stderr)
@@ -6,6 +6,8 @@ Usage:
     # Fetch ALL studies for a drug (primary workflow: search + download everything)
     python scripts/ctgov_fetch.py fetch-all --drug izokibep --output-dir data/
     python scripts/ctgov_fetch.py fetch-all --drug izokibep --sponsor "ACELYRIN"
+    python scripts/ctgov_fetch.py fetch-all --drug izokibep --workers 1   # sequential
+    python scripts/ctgov_fetch.py fetch-all --drug izokibep --refresh     # only changed studies
 
     # Search only (returns summary list, no downloads)
     python scripts/ctgov_fetch.py search --drug izokibep
@@ -14,6 +16,9 @@ Usage:
     # Download specific study records by NCT ID
     python scripts/ctgov_fetch.py fetch --nct NCT05355805
     python scripts/ctgov_fetch.py fetch --nct NCT05355805 --nct NCT05623345
+
+Study records are kept once per NCT ID in the shared study store
+(see study_store.py); --export-json also writes them as indented JSON.
 """
 
 import argparse
@@ -21,11 +26,25 @@ import json
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import requests
 
+from comparison_builder import study_features
+from http_client import HttpClient
+from study_store import get_store
+
 CTGOV_API_BASE = "https://clinicaltrials.gov/api/v2/studies"
 RATE_LIMIT_DELAY = 1.0  # 1 request per second max
+FETCH_WORKERS = 4  # concurrent study downloads in fetch-all
+
+
+CTGOV_CLIENT = HttpClient(
+    "clinicaltrials.gov",
+    headers={"Accept": "application/json"},
+    rate=1.0 / RATE_LIMIT_DELAY,
+    pool_size=FETCH_WORKERS,
+)
 
 
 def _safe_get(obj, *keys, default=None):
@@ -43,38 +62,50 @@ def _safe_get(obj, *keys, default=None):
     return current
 
 
-def fetch_study(nct_id: str, output_dir: str = ".") -> dict:
+def fetch_study(
+    nct_id: str,
+    output_dir: str = ".",
+    export_json: bool = False,
+    last_update_date: str = None,
+) -> dict:
     """Fetch a full study record from ClinicalTrials.gov API v2.
 
-    Returns a summary dict with key metadata and paths to saved files.
+    The shared study store is checked first: a stored copy is used when
+    its lastUpdatePostDate matches ``last_update_date``, or, without one,
+    when it is younger than STORE_TTL. Fetched records are added to it.
+
+    Returns a summary dict with key metadata and a reference to the store
+    (plus paths of the indented JSON files when ``export_json`` is set).
     """
+    if get_store().is_current(nct_id, last_update_date):
+        return _stored_study(nct_id, output_dir, export_json)
+
     url = f"{CTGOV_API_BASE}/{nct_id}"
-    headers = {"Accept": "application/json"}
 
-    time.sleep(RATE_LIMIT_DELAY)
     try:
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = CTGOV_CLIENT.get(url)
     except requests.RequestException as e:
         # Retry once after 3 seconds
         print(f"Request failed for {nct_id}, retrying in 3s: {e}", file=sys.stderr)
         time.sleep(3)
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = CTGOV_CLIENT.get(url)
 
     if resp.status_code == 404:
         return {"error": f"Study {nct_id} not found on ClinicalTrials.gov. Verify the NCT number."}
     if resp.status_code in (500, 503):
         print(f"Server error {resp.status_code} for {nct_id}, retrying in 3s...", file=sys.stderr)
         time.sleep(3)
-        resp = requests.get(url, headers=headers, timeout=30)
+        resp = CTGOV_CLIENT.get(url)
     resp.raise_for_status()
 
-    raw_data = resp.json()
+    return _save_study(nct_id, resp.json(), output_dir, export_json)
+
 
-    # Save raw JSON
-    raw_path = os.path.join(output_dir, f"ctgov_{nct_id}.json")
-    with open(raw_path, "w", encoding="utf-8") as f:
-        json.dump(raw_data, f, indent=2, ensure_ascii=False)
+def _save_study(nct_id: str, raw_data: dict, output_dir: str, export_json: bool = False) -> dict:
+    """Extract and store one fetched study record.
 
+    Returns the fetch_study summary dict.
+    """
     # Check results availability
     results_section = raw_data.get("resultsSection")
     has_results = results_section is not None and bool(results_section)
@@ -82,19 +113,37 @@ def fetch_study(nct_id: str, output_dir: str = ".") -> dict:
     # Extract structured fields
     structured = _extract_structured(raw_data, has_results)
 
-    # Save structured extraction
-    structured_path = os.path.join(output_dir, f"ctgov_{nct_id}_structured.json")
-    with open(structured_path, "w", encoding="utf-8") as f:
-        json.dump(structured, f, indent=2, ensure_ascii=False)
+    store = get_store()
+    store.put(nct_id, raw_data, structured)
+    entry = _study_entry(nct_id, structured)
+    if export_json:
+        entry.update(store.export_json(nct_id, output_dir))
+    return entry
+
+
+# Structured modules a manifest entry is built from
+SUMMARY_MODULES = ("identification", "status", "sponsor", "has_results")
 
+
+def _stored_study(nct_id: str, output_dir: str, export_json: bool = False) -> dict:
+    """fetch_study summary dict for a study already in the store."""
+    store = get_store()
+    entry = _study_entry(nct_id, store.get_structured(nct_id, SUMMARY_MODULES))
+    if export_json:
+        entry.update(store.export_json(nct_id, output_dir))
+    return entry
+
+
+def _study_entry(nct_id: str, structured: dict) -> dict:
+    """Manifest entry for a study in the store."""
     return {
         "nct_id": nct_id,
         "brief_title": structured["identification"]["brief_title"],
         "overall_status": structured["status"]["overall_status"],
-        "has_results": has_results,
+        "has_results": structured["has_results"],
         "sponsor": structured["sponsor"]["name"],
-        "raw_file": raw_path,
-        "structured_file": structured_path,
+        "last_update_date": structured["status"]["last_update_date"],
+        "store": get_store().path,
     }
 
 
@@ -213,6 +262,9 @@ def _extract_structured(data: dict, has_results: bool) -> dict:
         results = data.get("resultsSection", {})
         structured["results"] = _extract_results(results)
 
+    # Derived fields the comparisons read (phases, dates, endpoint terms)
+    structured["features"] = study_features(structured)
+
     return structured
 
 
@@ -269,11 +321,106 @@ def _extract_results(results: dict) -> dict:
     }
 
 
+def _previous_studies(drug_dir: str) -> dict[str, dict]:
+    """Study entries from the drug directory's existing manifest, by NCT ID."""
+    try:
+        with open(os.path.join(drug_dir, "manifest.json"), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return {s["nct_id"]: s for s in manifest.get("studies", [])}
+
+
+BULK_CHUNK_SIZE = 20  # NCT IDs per filter.ids request
+
+
+def _fetch_chunk(nct_ids: list[str]) -> dict[str, dict]:
+    """Full records for up to BULK_CHUNK_SIZE studies, keyed by NCT ID."""
+    params = {
+        "filter.ids": ",".join(nct_ids),
+        "pageSize": len(nct_ids),
+        "format": "json",
+    }
+    records = {}
+    token = None
+    while True:
+        data = _studies_page(params, token)
+        for study in data.get("studies", []):
+            nct_id = _safe_get(study, "protocolSection", "identificationModule", "nctId", default="")
+            records[nct_id.upper()] = study
+        token = data.get("nextPageToken")
+        if not token:
+            return records
+
+
+def fetch_studies(
+    nct_ids: list[str],
+    output_dir: str = ".",
+    workers: int = FETCH_WORKERS,
+    export_json: bool = False,
+    markers: dict[str, str] = None,
+) -> list[dict]:
+    """Fetch many studies, from the study store or with bulk filter.ids requests.
+
+    Studies current in the store (per ``markers``, NCT ID → the search
+    hit's lastUpdatePostDate; see ``fetch_study``) are not requested. The
+    rest are resolved in about ceil(N / BULK_CHUNK_SIZE) requests, with up
+    to ``workers`` chunks in flight under CTGOV_CLIENT's rate limit.
+
+    Returns one ``fetch_study``-style dict per input ID, in input order;
+    IDs that could not be fetched get an {"error": ...} dict.
+    """
+    markers = markers or {}
+    store = get_store()
+    outcomes = {
+        nct_id: _stored_study(nct_id, output_dir, export_json)
+        for nct_id in nct_ids
+        if store.is_current(nct_id, markers.get(nct_id))
+    }
+    if outcomes:
+        print(f"  {len(outcomes)} studies current in the local study store", file=sys.stderr)
+    remaining = [nct_id for nct_id in nct_ids if nct_id not in outcomes]
+
+    chunks = [remaining[i:i + BULK_CHUNK_SIZE] for i in range(0, len(remaining), BULK_CHUNK_SIZE)]
+    total = len(remaining)
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(_fetch_chunk, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            chunk = futures[future]
+            try:
+                records = future.result()
+            except Exception as e:
+                records, failure = {}, str(e)
+            else:
+                failure = None
+            for nct_id in chunk:
+                done += 1
+                if nct_id.upper() in records:
+                    result = _save_study(nct_id, records[nct_id.upper()], output_dir, export_json)
+                    status_str = "POSTED" if result["has_results"] else "NOT YET POSTED"
+                    line = (f"{result['brief_title'][:60]}\n"
+                            f"    Status: {result['overall_status']} | Results: {status_str}")
+                elif failure:
+                    result = {"error": failure}
+                    line = f"FAILED: {failure}"
+                else:
+                    result = {"error": f"Study {nct_id} not found on ClinicalTrials.gov. "
+                                       "Verify the NCT number."}
+                    line = f"ERROR: {result['error']}"
+                outcomes[nct_id] = result
+                print(f"  [{done}/{total}] {nct_id}: {line}", file=sys.stderr)
+    return [outcomes[nct_id] for nct_id in nct_ids]
+
+
 def fetch_all_for_drug(
     drug_name: str,
     output_dir: str = ".",
     sponsor_filter: str = None,
     max_results: int = 50,
+    workers: int = FETCH_WORKERS,
+    refresh: bool = False,
+    export_json: bool = False,
 ) -> dict:
     """Search for all studies involving a drug, then fetch every one.
 
@@ -281,6 +428,17 @@ def fetch_all_for_drug(
     we search ClinicalTrials.gov by drug name, download ALL matching studies,
     and return a manifest the comparison_builder can consume.
 
+    Studies already in the shared study store with the search hit's
+    lastUpdatePostDate are not downloaded again; the rest are fetched with
+    bulk filter.ids requests, up to ``workers`` at a time sharing
+    CTGOV_CLIENT's rate limiter and connection pool. The manifest lists
+    them in search-result order as references into the store (plus
+    indented JSON files when ``export_json`` is set).
+
+    With ``refresh``, the drug directory's existing manifest is compared
+    against the search and the manifest carries a "refresh" entry with
+    unchanged/updated/new counts.
+
     Returns:
         {
           "drug_name": str,
@@ -316,24 +474,24 @@ def fetch_all_for_drug(
     with open(search_manifest_path, "w", encoding="utf-8") as f:
         json.dump(search_results, f, indent=2, ensure_ascii=False)
 
-    # Fetch every study
+    # Version markers decide which stored studies are still current
+    nct_ids = [sr["nct_id"] for sr in search_results]
+    markers = {sr["nct_id"]: sr.get("last_update_date") for sr in search_results}
+    previous = _previous_studies(drug_dir) if refresh else {}
+    unchanged = {
+        nct_id for nct_id in nct_ids
+        if nct_id in previous and get_store().is_current(nct_id, markers[nct_id])
+    }
+
+    # Fetch every study not current in the store, in bulk
+    results = fetch_studies(nct_ids, drug_dir, workers, export_json, markers)
     fetched = []
     errors = []
-    for i, sr in enumerate(search_results, 1):
-        nct_id = sr["nct_id"]
-        print(f"  [{i}/{len(search_results)}] Fetching {nct_id}: {sr['brief_title'][:60]}...", file=sys.stderr)
-        try:
-            result = fetch_study(nct_id, drug_dir)
-            if "error" in result:
-                print(f"    ERROR: {result['error']}", file=sys.stderr)
-                errors.append({"nct_id": nct_id, "error": result["error"]})
-            else:
-                status_str = "POSTED" if result["has_results"] else "NOT YET POSTED"
-                print(f"    Status: {result['overall_status']} | Results: {status_str}", file=sys.stderr)
-                fetched.append(result)
-        except Exception as e:
-            print(f"    FAILED: {e}", file=sys.stderr)
-            errors.append({"nct_id": nct_id, "error": str(e)})
+    for nct_id, result in zip(nct_ids, results):
+        if "error" in result:
+            errors.append({"nct_id": nct_id, "error": result["error"]})
+        else:
+            fetched.append(result)
 
     studies_with_results = sum(1 for s in fetched if s.get("has_results"))
 
@@ -346,6 +504,12 @@ def fetch_all_for_drug(
         "errors": errors,
         "output_dir": drug_dir,
     }
+    if refresh:
+        manifest["refresh"] = {
+            "unchanged": len(unchanged),
+            "updated": sum(1 for n in nct_ids if n in previous and n not in unchanged),
+            "new": sum(1 for n in nct_ids if n not in previous),
+        }
 
     # Save the full manifest
     manifest_path = os.path.join(drug_dir, "manifest.json")
@@ -353,10 +517,84 @@ def fetch_all_for_drug(
         json.dump(manifest, f, indent=2, ensure_ascii=False)
     print(f"\n  Manifest saved: {manifest_path}", file=sys.stderr)
     print(f"  {len(fetched)} studies fetched ({studies_with_results} with results, {len(errors)} errors)", file=sys.stderr)
+    if refresh:
+        r = manifest["refresh"]
+        print(f"  Refresh: {r['unchanged']} unchanged, {r['updated']} updated, {r['new']} new",
+              file=sys.stderr)
 
     return manifest
 
 
+SEARCH_PAGE_SIZE = 1000  # API v2 maximum
+
+# Only the fields _summarize_search_hit reads; the API returns them in
+# their usual nested positions.
+SEARCH_FIELDS = ",".join([
+    "protocolSection.identificationModule.nctId",
+    "protocolSection.identificationModule.briefTitle",
+    "protocolSection.statusModule.overallStatus",
+    "protocolSection.statusModule.startDateStruct",
+    "protocolSection.statusModule.completionDateStruct",
+    "protocolSection.statusModule.lastUpdatePostDateStruct",
+    "protocolSection.designModule.phases",
+    "protocolSection.designModule.enrollmentInfo",
+    "protocolSection.sponsorCollaboratorsModule.leadSponsor",
+    "protocolSection.conditionsModule.conditions",
+    "protocolSection.armsInterventionsModule.interventions",
+    "hasResults",
+])
+
+
+def _studies_page(params: dict, page_token: str = None) -> dict:
+    """Fetch one page of /studies results (search or filter.ids)."""
+    if page_token:
+        params = {**params, "pageToken": page_token}
+    try:
+        resp = CTGOV_CLIENT.get(CTGOV_API_BASE, params=params)
+    except requests.RequestException as e:
+        print(f"Search request failed, retrying in 3s: {e}", file=sys.stderr)
+        time.sleep(3)
+        resp = CTGOV_CLIENT.get(CTGOV_API_BASE, params=params)
+    resp.raise_for_status()
+    return resp.json()
+
+
+def _summarize_search_hit(study: dict) -> dict:
+    """Summary dict for one search hit."""
+    proto = study.get("protocolSection", {})
+    id_mod = proto.get("identificationModule", {})
+    status_mod = proto.get("statusModule", {})
+    design_mod = proto.get("designModule", {})
+    sponsor_mod = proto.get("sponsorCollaboratorsModule", {})
+    cond_mod = proto.get("conditionsModule", {})
+    ai_mod = proto.get("armsInterventionsModule", {})
+
+    enrollment_info = design_mod.get("enrollmentInfo", {})
+    lead_sponsor = sponsor_mod.get("leadSponsor", {})
+    has_results = study.get("hasResults", False)
+
+    # Extract intervention names
+    intervention_names = []
+    for iv in ai_mod.get("interventions", []):
+        intervention_names.append(iv.get("name", ""))
+
+    return {
+        "nct_id": id_mod.get("nctId", ""),
+        "brief_title": id_mod.get("briefTitle", ""),
+        "overall_status": status_mod.get("overallStatus", ""),
+        "phases": design_mod.get("phases", []),
+        "enrollment": enrollment_info.get("count"),
+        "enrollment_type": enrollment_info.get("type", ""),
+        "sponsor": lead_sponsor.get("name", ""),
+        "conditions": cond_mod.get("conditions", []),
+        "interventions": intervention_names,
+        "start_date": _safe_get(status_mod, "startDateStruct", "date", default=""),
+        "completion_date": _safe_get(status_mod, "completionDateStruct", "date", default=""),
+        "last_update_date": _safe_get(status_mod, "lastUpdatePostDateStruct", "date", default=""),
+        "has_results": has_results,
+    }
+
+
 def search_by_name(
     drug_name: str,
     max_results: int = 50,
@@ -365,74 +603,52 @@ def search_by_name(
     """Search ClinicalTrials.gov for studies involving a drug/intervention name.
 
     Uses the API v2 query.intr parameter. Returns a list of study summaries
-    (no full download — caller picks NCTs to fetch in full).
+    (no full download — caller picks NCTs to fetch in full). Follows
+    nextPageToken until ``max_results`` hits are collected, requesting the
+    next page while the current one is summarized, and asks only for the
+    fields the summary uses.
 
     Args:
         drug_name: Drug or intervention name to search for (e.g. "izokibep").
-        max_results: Max number of studies to return (default 50).
+        max_results: Max number of studies to return (default 50; 0 for all).
         sponsor_filter: Optional sponsor name to narrow results.
 
     Returns:
         List of dicts with: nct_id, brief_title, overall_status, phases,
-        enrollment, sponsor, conditions, interventions, start_date, has_results.
+        enrollment, sponsor, conditions, interventions, start_date,
+        completion_date, last_update_date, has_results.
     """
+    limit = max_results if max_results and max_results > 0 else None
     params = {
         "query.intr": drug_name,
-        "pageSize": min(max_results, 100),
+        "pageSize": min(limit or SEARCH_PAGE_SIZE, SEARCH_PAGE_SIZE),
+        "fields": SEARCH_FIELDS,
+        "countTotal": "true",
         "format": "json",
     }
     if sponsor_filter:
         params["query.spons"] = sponsor_filter
 
-    headers = {"Accept": "application/json"}
-    url = CTGOV_API_BASE
-
-    time.sleep(RATE_LIMIT_DELAY)
-    try:
-        resp = requests.get(url, params=params, headers=headers, timeout=30)
-    except requests.RequestException as e:
-        print(f"Search request failed, retrying in 3s: {e}", file=sys.stderr)
-        time.sleep(3)
-        resp = requests.get(url, params=params, headers=headers, timeout=30)
-
-    resp.raise_for_status()
-    data = resp.json()
-
-    studies = data.get("studies", [])
     results = []
-    for study in studies:
-        proto = study.get("protocolSection", {})
-        id_mod = proto.get("identificationModule", {})
-        status_mod = proto.get("statusModule", {})
-        design_mod = proto.get("designModule", {})
-        sponsor_mod = proto.get("sponsorCollaboratorsModule", {})
-        cond_mod = proto.get("conditionsModule", {})
-        ai_mod = proto.get("armsInterventionsModule", {})
-
-        enrollment_info = design_mod.get("enrollmentInfo", {})
-        lead_sponsor = sponsor_mod.get("leadSponsor", {})
-        has_results = study.get("hasResults", False)
-
-        # Extract intervention names
-        intervention_names = []
-        for iv in ai_mod.get("interventions", []):
-            intervention_names.append(iv.get("name", ""))
-
-        results.append({
-            "nct_id": id_mod.get("nctId", ""),
-            "brief_title": id_mod.get("briefTitle", ""),
-            "overall_status": status_mod.get("overallStatus", ""),
-            "phases": design_mod.get("phases", []),
-            "enrollment": enrollment_info.get("count"),
-            "enrollment_type": enrollment_info.get("type", ""),
-            "sponsor": lead_sponsor.get("name", ""),
-            "conditions": cond_mod.get("conditions", []),
-            "interventions": intervention_names,
-            "start_date": _safe_get(status_mod, "startDateStruct", "date", default=""),
-            "completion_date": _safe_get(status_mod, "completionDateStruct", "date", default=""),
-            "has_results": has_results,
-        })
-
+    with ThreadPoolExecutor(max_workers=1) as prefetch:
+        data = _studies_page(params)
+        total = data.get("totalCount")
+        while True:
+            studies = data.get("studies", [])
+            token = data.get("nextPageToken")
+            wanted_more = limit is None or len(results) + len(studies) < limit
+            pending = prefetch.submit(_studies_page, params, token) if token and wanted_more else None
+
+            results.extend(_summarize_search_hit(study) for study in studies)
+            if pending is None:
+                break
+            data = pending.result()
+
+    if limit is not None and len(results) > limit:
+        results = results[:limit]
+    if total is not None and total > len(results):
+        print(f"  Note: {total} studies match '{drug_name}'; returning the first "
+              f"{len(results)} (raise --max-results, or 0 for all)", file=sys.stderr)
     return results
 
 
@@ -442,6 +658,10 @@ def main():
     parser = argparse.ArgumentParser(
         description="ClinicalTrials.gov study fetcher (API v2)"
     )
+    parser.add_argument(
+        "--http-stats", action="store_true",
+        help="Print request count, bytes and time-to-first-byte to stderr",
+    )
     subparsers = parser.add_subparsers(dest="action", help="Action to perform")
 
     # fetch action — download full study records by NCT ID
@@ -454,6 +674,10 @@ def main():
         "--output-dir", default=".",
         help="Directory to save JSON files (default: current directory)",
     )
+    fetch_parser.add_argument(
+        "--export-json", action="store_true",
+        help="Also write indented ctgov_<NCT>.json / _structured.json files (debug export)",
+    )
 
     # search action — search for studies by drug name
     search_parser = subparsers.add_parser("search", help="Search studies by drug/intervention name")
@@ -465,7 +689,7 @@ def main():
     )
     search_parser.add_argument(
         "--max-results", type=int, default=50,
-        help="Maximum number of results (default: 50)",
+        help="Maximum number of results, 0 for all (default: 50)",
     )
 
     # fetch-all action — search by drug name, then download ALL studies
@@ -484,25 +708,30 @@ def main():
     )
     fetchall_parser.add_argument(
         "--max-results", type=int, default=50,
-        help="Maximum number of results (default: 50)",
+        help="Maximum number of results, 0 for all (default: 50)",
+    )
+    fetchall_parser.add_argument(
+        "--export-json", action="store_true",
+        help="Also write indented ctgov_<NCT>.json / _structured.json files (debug export)",
+    )
+    fetchall_parser.add_argument(
+        "--refresh", action="store_true",
+        help="Reuse the existing manifest; only download studies whose "
+             "lastUpdatePostDate changed, plus new ones",
+    )
+    fetchall_parser.add_argument(
+        "--workers", type=int, default=FETCH_WORKERS,
+        help=f"Concurrent downloads, sharing one {1.0 / RATE_LIMIT_DELAY:g} req/s "
+             f"rate limit (default: {FETCH_WORKERS})",
     )
 
     args = parser.parse_args()
 
     if args.action == "fetch":
         os.makedirs(args.output_dir, exist_ok=True)
-        results = []
-        for nct_id in args.nct:
-            nct_id = nct_id.strip().upper()
-            print(f"Fetching {nct_id}...", file=sys.stderr)
-            result = fetch_study(nct_id, args.output_dir)
-            results.append(result)
-            if "error" in result:
-                print(f"  ERROR: {result['error']}", file=sys.stderr)
-            else:
-                status = "POSTED" if result["has_results"] else "NOT YET POSTED"
-                print(f"  {result['brief_title']}", file=sys.stderr)
-                print(f"  Status: {result['overall_status']} | Results: {status}", file=sys.stderr)
+        nct_ids = [nct_id.strip().upper() for nct_id in args.nct]
+        print(f"Fetching {len(nct_ids)} studies...", file=sys.stderr)
+        results = fetch_studies(nct_ids, args.output_dir, export_json=args.export_json)
         print(json.dumps(results, indent=2))
 
     elif args.action == "search":
@@ -523,6 +752,9 @@ def main():
             output_dir=args.output_dir,
             sponsor_filter=args.sponsor,
             max_results=args.max_results,
+            workers=args.workers,
+            refresh=args.refresh,
+            export_json=args.export_json,
         )
         print(json.dumps(manifest, indent=2))
 
@@ -531,6 +763,9 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    if args.http_stats:
+        CTGOV_CLIENT.print_stats()
+
 
 if __name__ == "__main__":
     main()
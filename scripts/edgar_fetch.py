@@ -8,14 +8,20 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 
+from filing_archive import FilingArchive, get_archive
+from http_client import HttpClient
+
 HEADERS = {
     "User-Agent": "S1DisclosureChecker/1.0 (contact@example.com)",
     "Accept-Encoding": "gzip, deflate",
@@ -26,20 +32,146 @@ RATE_LIMIT_DELAY = 0.2  # seconds between requests (max 10 req/sec)
 COMPANY_TICKERS_URL = "https://www.sec.gov/files/company_tickers.json"
 EFTS_SEARCH_URL = "https://efts.sec.gov/LATEST/search-index"
 
+EDGAR_CACHE_DIR = os.environ.get("S1_EDGAR_CACHE_DIR") or os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "s1_checker", "edgar",
+)
+TICKERS_TTL = 24 * 3600  # seconds before company_tickers.json is revalidated
+SUBMISSIONS_TTL = 3600  # seconds before a CIK's submissions JSON is revalidated
+OLDER_FILES_TTL = 7 * 24 * 3600  # paged history files only change when re-paged
+OLDER_FILES_WORKERS = 4  # concurrent fetches of older submissions files
+
+
+# One pooled keep-alive session for www.sec.gov, data.sec.gov and efts.sec.gov.
+EDGAR_CLIENT = HttpClient("sec.gov", headers=HEADERS, rate=1.0 / RATE_LIMIT_DELAY)
+
 
 def _rate_limited_get(url, **kwargs):
-    """GET with User-Agent header and rate-limit delay."""
-    headers = {**HEADERS, **kwargs.pop("headers", {})}
-    time.sleep(RATE_LIMIT_DELAY)
-    resp = requests.get(url, headers=headers, timeout=30, **kwargs)
+    """GET through the pooled EDGAR session with User-Agent header and rate limit."""
+    resp = EDGAR_CLIENT.get(url, **kwargs)
     if resp.status_code in (403, 429):
         print("EDGAR rate limit hit. Waiting 5 s and retrying...", file=sys.stderr)
+        resp.close()  # a streamed response holds its pooled connection until closed
         time.sleep(5)
-        resp = requests.get(url, headers=headers, timeout=30, **kwargs)
+        resp = EDGAR_CLIENT.get(url, **kwargs)
     resp.raise_for_status()
     return resp
 
 
+# ── Local cache ───────────────────────────────────────────────────────
+
+def _read_json(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_json(path: str, obj):
+    """Write JSON via a temp file and atomic rename."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _conditional_get_json(url: str, cache_path: str, ttl: float):
+    """Return JSON from ``url`` through an on-disk copy.
+
+    The copy is used as-is while younger than ``ttl`` seconds, then
+    revalidated with If-None-Match / If-Modified-Since so an unchanged
+    document costs a 304 rather than a full download. If EDGAR is
+    unreachable a stale copy is returned with a warning.
+    """
+    cached = _read_json(cache_path)
+    if cached and time.time() - cached.get("fetched_at", 0) < ttl:
+        return cached["data"]
+
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+    try:
+        resp = _rate_limited_get(url, headers=headers)
+    except requests.RequestException as e:
+        if cached:
+            print(f"Could not refresh {url} ({e}); using cached copy.", file=sys.stderr)
+            return cached["data"]
+        raise
+
+    if resp.status_code == 304 and cached:
+        cached["fetched_at"] = time.time()
+    else:
+        cached = {
+            "url": url,
+            "fetched_at": time.time(),
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "data": resp.json(),
+        }
+    _write_json(cache_path, cached)
+    return cached["data"]
+
+
+class TickerStore:
+    """Local mirror of company_tickers.json with an in-memory ticker index.
+
+    The mirror lives in EDGAR_CACHE_DIR and is revalidated with a
+    conditional GET once it is older than ``ttl``; lookups are dict hits.
+    Answers from the EFTS fallback (delisted tickers) are remembered in
+    efts_tickers.json: hits permanently, misses until ``ttl`` expires.
+    """
+
+    def __init__(self, cache_dir: str = EDGAR_CACHE_DIR, ttl: float = TICKERS_TTL):
+        self.tickers_path = os.path.join(cache_dir, "company_tickers.json")
+        self.efts_path = os.path.join(cache_dir, "efts_tickers.json")
+        self.ttl = ttl
+        self._by_ticker = None
+        self._loaded_at = 0.0
+        self._efts = None
+        self._efts_lock = threading.Lock()  # lookups run on several threads
+
+    def _index(self) -> dict:
+        if self._by_ticker is None or time.time() - self._loaded_at >= self.ttl:
+            data = _conditional_get_json(COMPANY_TICKERS_URL, self.tickers_path, self.ttl)
+            by_ticker = {}
+            for entry in data.values():
+                by_ticker.setdefault(entry["ticker"].upper(), entry)
+            self._by_ticker = by_ticker
+            self._loaded_at = time.time()
+        return self._by_ticker
+
+    def get(self, ticker: str) -> dict | None:
+        """Active-list entry for ``ticker``, or None."""
+        return self._index().get(ticker.upper())
+
+    def efts_answer(self, ticker: str) -> tuple[bool, dict | None]:
+        """(known, entry) for a remembered EFTS fallback lookup."""
+        with self._efts_lock:
+            if self._efts is None:
+                self._efts = _read_json(self.efts_path) or {}
+            memo = self._efts.get(ticker.upper())
+        if memo is None:
+            return False, None
+        if memo["entry"] is None and time.time() - memo["fetched_at"] >= self.ttl:
+            return False, None
+        return True, memo["entry"]
+
+    def remember_efts(self, ticker: str, entry: dict | None):
+        with self._efts_lock:
+            if self._efts is None:
+                self._efts = _read_json(self.efts_path) or {}
+            self._efts[ticker.upper()] = {"entry": entry, "fetched_at": time.time()}
+            _write_json(self.efts_path, self._efts)
+
+
+_TICKER_STORE = TickerStore()
+
+
 # ── Step 1: Ticker → CIK ─────────────────────────────────────────────
 
 def _efts_ticker_search(ticker: str) -> dict | None:
@@ -69,18 +201,18 @@ def _efts_ticker_search(ticker: str) -> dict | None:
 
 def ticker_to_cik(ticker: str) -> dict:
     """Return {"cik_str": int, "ticker": str, "title": str} or raise."""
-    # Primary: active tickers file
-    resp = _rate_limited_get(COMPANY_TICKERS_URL)
-    data = resp.json()
-    ticker_upper = ticker.upper()
-    for entry in data.values():
-        if entry["ticker"].upper() == ticker_upper:
-            return entry
-
-    # Fallback: EFTS search (catches delisted tickers)
-    print(f"Ticker {ticker} not in active list, searching EDGAR filings...",
-          file=sys.stderr)
-    result = _efts_ticker_search(ticker)
+    # Primary: active tickers file (local mirror)
+    entry = _TICKER_STORE.get(ticker)
+    if entry:
+        return entry
+
+    # Fallback: EFTS search (catches delisted tickers), remembered locally
+    known, result = _TICKER_STORE.efts_answer(ticker)
+    if not known:
+        print(f"Ticker {ticker} not in active list, searching EDGAR filings...",
+              file=sys.stderr)
+        result = _efts_ticker_search(ticker)
+        _TICKER_STORE.remember_efts(ticker, result)
     if result:
         return result
 
@@ -101,6 +233,42 @@ def _search_filings(recent: dict) -> int | None:
     return None
 
 
+def _submissions_json(name: str, ttl: float):
+    """Fetch a data.sec.gov submissions file through the per-CIK cache."""
+    return _conditional_get_json(
+        f"https://data.sec.gov/submissions/{name}",
+        os.path.join(EDGAR_CACHE_DIR, "submissions", name),
+        ttl,
+    )
+
+
+def _search_older_filings(older_files: list[dict]) -> tuple[dict | None, int | None]:
+    """Find the first S-1/F-1 in the paged submission history files.
+
+    Files are fetched through a sliding window of OLDER_FILES_WORKERS
+    in-flight requests but examined in list order, so the result matches
+    a sequential walk; once a file matches, no further files are requested.
+    """
+    if not older_files:
+        return None, None
+    names = [older["name"] for older in older_files]
+    with ThreadPoolExecutor(max_workers=OLDER_FILES_WORKERS) as pool:
+        window = [pool.submit(_submissions_json, name, OLDER_FILES_TTL)
+                  for name in names[:OLDER_FILES_WORKERS]]
+        next_i = len(window)
+        while window:
+            older_data = window.pop(0).result()
+            idx = _search_filings(older_data)
+            if idx is not None:
+                for pending in window:
+                    pending.cancel()
+                return older_data, idx
+            if next_i < len(names):
+                window.append(pool.submit(_submissions_json, names[next_i], OLDER_FILES_TTL))
+                next_i += 1
+    return None, None
+
+
 def lookup(ticker: str) -> dict:
     """Full lookup: ticker → filing metadata + document URL."""
     # Step 1
@@ -108,10 +276,8 @@ def lookup(ticker: str) -> dict:
     cik_raw = entry["cik_str"]
     cik_padded = str(cik_raw).zfill(10)
 
-    # Step 2 — fetch submission history
-    submissions_url = f"https://data.sec.gov/submissions/CIK{cik_padded}.json"
-    resp = _rate_limited_get(submissions_url)
-    sub = resp.json()
+    # Step 2 — fetch submission history (cached per CIK)
+    sub = _submissions_json(f"CIK{cik_padded}.json", SUBMISSIONS_TTL)
 
     company_name = sub.get("name", "")
     tickers = sub.get("tickers", [])
@@ -121,15 +287,9 @@ def lookup(ticker: str) -> dict:
 
     # If not found in recent, check older filing index files
     if idx is None:
-        older_files = sub.get("filings", {}).get("files", [])
-        for older in older_files:
-            older_url = f"https://data.sec.gov/submissions/{older['name']}"
-            older_resp = _rate_limited_get(older_url)
-            older_data = older_resp.json()
-            idx = _search_filings(older_data)
-            if idx is not None:
-                recent = older_data
-                break
+        older_data, idx = _search_older_filings(sub.get("filings", {}).get("files", []))
+        if idx is not None:
+            recent = older_data
 
     if idx is None:
         raise SystemExit(
@@ -166,17 +326,138 @@ def lookup(ticker: str) -> dict:
 
 # ── Action: download ──────────────────────────────────────────────────
 
-def download(ticker: str, url: str, filing_date: str = "") -> str:
-    """Download the S-1 HTML document and save locally."""
-    resp = _rate_limited_get(url)
-    date_part = filing_date if filing_date else str(int(time.time()))
-    filename = f"s1_{ticker.upper()}_{date_part}.html"
-    filepath = os.path.join(os.getcwd(), filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(resp.text)
-    size_kb = os.path.getsize(filepath) / 1024
-    print(f"Downloaded: {filepath} ({size_kb:.0f} KB)", file=sys.stderr)
-    return filepath
+DOWNLOAD_CHUNK_SIZE = 1 << 16
+
+ARCHIVE_URL_RE = re.compile(r"/Archives/edgar/data/(\d+)/(\d{10})(\d{2})(\d{6})/")
+
+
+def _parse_archive_url(url: str) -> tuple[str, str]:
+    """(padded CIK, dashed accession) from an EDGAR archive URL, or ("", "")."""
+    m = ARCHIVE_URL_RE.search(url)
+    if not m:
+        return "", ""
+    return m.group(1).zfill(10), "-".join(m.group(2, 3, 4))
+
+
+def _validator_path(part_path: str) -> str:
+    return part_path + ".validator"
+
+
+def _response_validator(resp) -> str:
+    """Strong ETag, else Last-Modified, usable as an If-Range value ("" if none)."""
+    etag = resp.headers.get("ETag", "")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return resp.headers.get("Last-Modified", "")
+
+
+def _discard_partial(part_path: str):
+    for path in (part_path, _validator_path(part_path)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _stream_to_file(url: str, part_path: str) -> int:
+    """Stream ``url`` into ``part_path``, resuming a partial file with Range.
+
+    Returns the final size in bytes. The body is requested without
+    content encoding so byte offsets in the partial file line up with
+    the server's. The document's validator (ETag or Last-Modified) is kept
+    in a sidecar next to the partial file and sent as If-Range on resume,
+    so a document that changed in between is fetched whole instead of
+    being appended to the stale prefix. A partial file without a
+    validator is not resumed.
+    """
+    validator_path = _validator_path(part_path)
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    validator = ""
+    if offset:
+        try:
+            with open(validator_path, "r", encoding="utf-8") as f:
+                validator = f.read().strip()
+        except OSError:
+            pass
+        if not validator:
+            offset = 0
+    headers = {"Accept-Encoding": "identity"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator
+    try:
+        resp = _rate_limited_get(url, headers=headers, stream=True)
+    except requests.HTTPError as e:
+        if offset and e.response is not None and e.response.status_code == 416:
+            # Partial file no longer matches the document; start over.
+            _discard_partial(part_path)
+            return _stream_to_file(url, part_path)
+        raise
+
+    with resp:
+        if offset and resp.status_code != 206:
+            # Server ignored the Range header or the document changed
+            # (If-Range mismatch); rewrite from the start.
+            offset = 0
+        elif offset:
+            print(f"Resuming download at {offset / 1024:.0f} KB", file=sys.stderr)
+        if not offset:
+            _discard_partial(part_path)
+            validator = _response_validator(resp)
+            if validator:
+                with open(validator_path, "w", encoding="utf-8") as f:
+                    f.write(validator)
+        with open(part_path, "ab" if offset else "wb") as f:
+            for chunk in resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                EDGAR_CLIENT.add_bytes(len(chunk))
+    return os.path.getsize(part_path)
+
+
+def download(
+    ticker: str,
+    url: str,
+    filing_date: str = "",
+    accession: str = "",
+    form_type: str = "",
+    archive: FilingArchive = None,
+) -> str:
+    """Download the S-1 HTML document into the compressed filing archive.
+
+    The body is streamed to a .part file in the archive's partial/
+    directory, in its original encoding; an interrupted download resumes
+    from it. The finished file is gzip-compressed into a content-addressed
+    blob and indexed by accession with ticker, CIK, form type and filing
+    date. If the accession is already archived nothing is fetched.
+
+    Returns the blob path, which s1_parser reads directly.
+    """
+    archive = archive or get_archive()
+    cik, url_accession = _parse_archive_url(url)
+    accession = accession or url_accession
+
+    known = archive.entry(accession) if accession else None
+    if known:
+        filepath = archive.blob_path(known["sha256"])
+        print(f"Already archived: {filepath} ({accession})", file=sys.stderr)
+        return filepath
+
+    part_key = accession or hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    part_path = archive.partial_path(part_key)
+    _stream_to_file(url, part_path)
+
+    entry = archive.put_file(
+        part_path, accession,
+        ticker=ticker.upper(), cik=cik, form_type=form_type,
+        filing_date=filing_date, url=url,
+    )
+    _discard_partial(part_path)
+    print(
+        f"Downloaded: {entry['path']} ({entry['bytes'] / 1024:.0f} KB, "
+        f"{entry['stored_bytes'] / 1024:.0f} KB compressed)",
+        file=sys.stderr,
+    )
+    return entry["path"]
 
 
 # ── CLI ───────────────────────────────────────────────────────────────
@@ -199,6 +480,20 @@ def main():
         default="",
         help="Filing date for download filename (e.g. 2023-05-03)",
     )
+    parser.add_argument(
+        "--accession",
+        default="",
+        help="Accession number, to skip re-downloading (default: parsed from --url)",
+    )
+    parser.add_argument(
+        "--form-type",
+        default="",
+        help="Form type recorded in the filing archive index (e.g. S-1)",
+    )
+    parser.add_argument(
+        "--http-stats", action="store_true",
+        help="Print request count, bytes and time-to-first-byte to stderr",
+    )
     args = parser.parse_args()
 
     if args.action == "lookup":
@@ -208,9 +503,13 @@ def main():
     elif args.action == "download":
         if not args.url:
             raise SystemExit("--url is required for download action")
-        filepath = download(args.ticker, args.url, args.filing_date)
+        filepath = download(args.ticker, args.url, args.filing_date, args.accession,
+                            args.form_type)
         print(json.dumps({"file_path": filepath}))
 
+    if args.http_stats:
+        EDGAR_CLIENT.print_stats()
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+filing_archive.py — Content-addressed, gzip-compressed store of downloaded filings.
+
+Each filing is stored once, as blobs/<sha256[:2]>/<sha256>.html.gz, where the
+hash is of the uncompressed document. index.json maps accession numbers to
+blobs along with ticker, CIK, form type and filing date, so the same filing
+fetched twice, or under two names, costs one blob.
+
+Parsers open filings through ``open_filing``, which accepts a plain HTML
+path, a gzip-compressed path, or an archive reference ``archive:<accession>``
+and always yields the uncompressed bytes.
+
+Usage:
+    python scripts/filing_archive.py list
+    python scripts/filing_archive.py list --ticker SLRN
+    python scripts/filing_archive.py add --file s1_SLRN_2023-05-03.html \
+        --accession 0001193125-23-123456 --ticker SLRN --form-type S-1 --filing-date 2023-05-03
+    python scripts/filing_archive.py export --accession 0001193125-23-123456 --output s1_SLRN.html
+"""
+
+import argparse
+import contextlib
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+
+try:
+    import fcntl
+except ImportError:  # no cross-process index lock on this platform
+    fcntl = None
+
+ARCHIVE_DIR = os.environ.get("S1_ARCHIVE_DIR") or os.path.join(
+    os.environ.get("XDG_DATA_HOME", os.path.join(os.path.expanduser("~"), ".local", "share")),
+    "s1_checker", "filings",
+)
+ARCHIVE_PREFIX = "archive:"
+GZIP_LEVEL = 9
+COPY_CHUNK_SIZE = 1 << 16
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class FilingArchive:
+    """Compressed filing blobs keyed by content hash, indexed by accession.
+
+    Index updates hold a thread lock plus, where available, an flock on
+    index.json.lock, and merge into the on-disk index rather than a cached
+    copy, so several threads, instances or processes can add filings to
+    the same root. Within a process, prefer one instance per root
+    (``get_archive``).
+    """
+
+    def __init__(self, root: str = ARCHIVE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.json")
+        self.partial_dir = os.path.join(root, "partial")
+        self._index = None
+        self._lock = threading.Lock()
+
+    # ── Index ──
+
+    def _load_index(self) -> dict:
+        if self._index is None:
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    self._index = json.load(f)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self):
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = f"{self.index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    @contextlib.contextmanager
+    def _index_lock(self):
+        """Exclusive access to index.json across threads and processes."""
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            os.makedirs(self.root, exist_ok=True)
+            with open(f"{self.index_path}.lock", "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def entry(self, accession: str) -> dict | None:
+        """Index entry for ``accession`` if its blob is present, else None."""
+        with self._lock:
+            entry = self._load_index().get(accession)
+            if entry is None:
+                # Another instance or process may have added it since
+                self._index = None
+                entry = self._load_index().get(accession)
+        if entry and os.path.exists(self.blob_path(entry["sha256"])):
+            return entry
+        return None
+
+    def find(self, ticker: str = None, cik: str = None, form_type: str = None) -> list[dict]:
+        """Index entries matching every given field, newest filing first."""
+        with self._lock:
+            entries = [{"accession": acc, **e} for acc, e in self._load_index().items()]
+        if ticker:
+            entries = [e for e in entries if e.get("ticker", "").upper() == ticker.upper()]
+        if cik:
+            entries = [e for e in entries if e.get("cik", "").lstrip("0") == str(cik).lstrip("0")]
+        if form_type:
+            entries = [e for e in entries if e.get("form_type", "") == form_type]
+        return sorted(entries, key=lambda e: e.get("filing_date", ""), reverse=True)
+
+    # ── Blobs ──
+
+    def blob_path(self, sha256: str) -> str:
+        return os.path.join(self.root, "blobs", sha256[:2], f"{sha256}.html.gz")
+
+    def partial_path(self, key: str) -> str:
+        """Scratch path for an in-progress download of ``key``."""
+        os.makedirs(self.partial_dir, exist_ok=True)
+        return os.path.join(self.partial_dir, f"{key}.part")
+
+    def put_file(self, filepath: str, accession: str = "", **meta) -> dict:
+        """Compress ``filepath`` into the archive and index it.
+
+        The file is hashed and compressed in one streaming pass; if a blob
+        with the same content already exists the new copy is discarded.
+        Without an accession the entry is keyed ``sha256:<hash>``.
+        Returns the index entry, including ``accession`` and ``path``.
+        """
+        os.makedirs(self.partial_dir, exist_ok=True)
+        tmp_path = os.path.join(self.partial_dir, f"put.{os.getpid()}.{threading.get_ident()}.gz")
+        h = hashlib.sha256()
+        size = 0
+        with open(filepath, "rb") as src, open(tmp_path, "wb") as raw:
+            # mtime=0 keeps blobs byte-identical for identical content.
+            with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=GZIP_LEVEL, mtime=0) as gz:
+                for chunk in iter(lambda: src.read(COPY_CHUNK_SIZE), b""):
+                    h.update(chunk)
+                    gz.write(chunk)
+                    size += len(chunk)
+        sha256 = h.hexdigest()
+
+        blob = self.blob_path(sha256)
+        if os.path.exists(blob):
+            os.remove(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.replace(tmp_path, blob)
+
+        key = accession or f"sha256:{sha256}"
+        entry = {
+            "sha256": sha256,
+            "bytes": size,
+            "stored_bytes": os.path.getsize(blob),
+            **{k: v for k, v in meta.items() if v},
+        }
+        with self._index_lock():
+            self._index = None  # merge into the current on-disk index
+            self._load_index()[key] = entry
+            self._save_index()
+        return {"accession": key, "path": blob, **entry}
+
+    def open(self, accession: str):
+        """Binary stream of the uncompressed filing for ``accession``."""
+        entry = self.entry(accession)
+        if entry is None:
+            raise FileNotFoundError(f"Accession not in archive: {accession}")
+        return gzip.open(self.blob_path(entry["sha256"]), "rb")
+
+
+_ARCHIVES = {}
+_ARCHIVES_LOCK = threading.Lock()
+
+
+def get_archive(root: str = None) -> FilingArchive:
+    """Process-wide FilingArchive for ``root`` (default ARCHIVE_DIR)."""
+    root = root or ARCHIVE_DIR
+    with _ARCHIVES_LOCK:
+        if root not in _ARCHIVES:
+            _ARCHIVES[root] = FilingArchive(root)
+        return _ARCHIVES[root]
+
+
+def resolve_filing_path(spec: str, archive: FilingArchive = None) -> str:
+    """Turn ``archive:<accession>`` into its blob path; other paths pass through."""
+    if spec.startswith(ARCHIVE_PREFIX):
+        archive = archive or get_archive()
+        accession = spec[len(ARCHIVE_PREFIX):]
+        entry = archive.entry(accession)
+        if entry is None:
+            raise FileNotFoundError(f"Accession not in archive: {accession}")
+        return archive.blob_path(entry["sha256"])
+    return spec
+
+
+def open_filing(spec: str):
+    """Open a filing for binary reading, decompressing gzip transparently."""
+    path = resolve_filing_path(spec)
+    with open(path, "rb") as f:
+        is_gzip = f.read(2) == GZIP_MAGIC
+    if is_gzip:
+        return gzip.open(path, "rb")  # owns, and closes, its file handle
+    return open(path, "rb")
+
+
+# ── CLI ───────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Compressed S-1/F-1 filing archive")
+    parser.add_argument("--archive-dir", default=ARCHIVE_DIR,
+                        help=f"Archive directory (default: $S1_ARCHIVE_DIR or {ARCHIVE_DIR})")
+    subparsers = parser.add_subparsers(dest="action", help="Action to perform")
+
+    list_parser = subparsers.add_parser("list", help="List archived filings")
+    list_parser.add_argument("--ticker", default=None)
+    list_parser.add_argument("--cik", default=None)
+    list_parser.add_argument("--form-type", default=None)
+
+    add_parser = subparsers.add_parser("add", help="Add an HTML file to the archive")
+    add_parser.add_argument("--file", required=True, help="Path to S-1 HTML file")
+    add_parser.add_argument("--accession", default="")
+    add_parser.add_argument("--ticker", default="")
+    add_parser.add_argument("--cik", default="")
+    add_parser.add_argument("--form-type", default="")
+    add_parser.add_argument("--filing-date", default="")
+
+    export_parser = subparsers.add_parser("export", help="Write an archived filing out as HTML")
+    export_parser.add_argument("--accession", required=True)
+    export_parser.add_argument("--output", required=True, help="Output HTML path")
+
+    args = parser.parse_args()
+    archive = FilingArchive(args.archive_dir)
+
+    if args.action == "list":
+        entries = archive.find(args.ticker, args.cik, args.form_type)
+        stored = sum(e.get("stored_bytes", 0) for e in entries)
+        raw = sum(e.get("bytes", 0) for e in entries)
+        print(f"{len(entries)} filings, {stored / 1024:.0f} KB stored "
+              f"({raw / 1024:.0f} KB uncompressed)", file=sys.stderr)
+        print(json.dumps(entries, indent=2, ensure_ascii=False))
+
+    elif args.action == "add":
+        entry = archive.put_file(
+            args.file, args.accession.strip(),
+            ticker=args.ticker.upper(), cik=args.cik, form_type=args.form_type,
+            filing_date=args.filing_date,
+        )
+        print(json.dumps(entry, indent=2, ensure_ascii=False))
+
+    elif args.action == "export":
+        with archive.open(args.accession) as src, open(args.output, "wb") as dst:
+            shutil.copyfileobj(src, dst, COPY_CHUNK_SIZE)
+        print(json.dumps({"file_path": args.output}))
+
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+http_client.py — Pooled, rate-limited HTTP clients shared by the fetch scripts.
+
+Each upstream (EDGAR, ClinicalTrials.gov) gets one HttpClient holding a
+persistent requests.Session, so repeated calls reuse keep-alive TCP/TLS
+connections instead of paying a handshake per request. The client also
+owns the upstream's rate limiter and keeps request/byte/latency counters.
+
+Usage:
+    from http_client import HttpClient
+    client = HttpClient("example", headers={"Accept": "application/json"}, rate=1.0)
+    resp = client.get("https://example.org/api", params={"q": "x"})
+    print(client.stats())
+"""
+
+import sys
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 8     # connections kept alive per host
+DEFAULT_POOL_HOSTS = 4    # hosts with their own connection pool
+DEFAULT_TIMEOUT = 30
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every request to one upstream.
+
+    Each ``acquire`` takes a token, sleeping only as long as needed for one
+    to accrue. Time spent waiting on the network counts toward the refill,
+    so a slow response is not followed by a full fixed delay, and any
+    number of worker threads together stay under ``rate`` requests/second.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._stamp = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._stamp) * self.rate)
+            self._stamp = now
+            # Reserve the token now; a negative balance queues later callers
+            # behind this one.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+class HttpClient:
+    """A pooled keep-alive session plus rate limiter and counters for one upstream.
+
+    Counters:
+        requests      responses received
+        failures      requests that raised before a response arrived
+        bytes         body bytes read off the wire (compressed size when gzipped)
+        ttfb_total_s  summed time from send to response headers
+        ttfb_max_s    slowest time to response headers
+        wait_total_s  time spent blocked on the rate limiter
+
+    Streamed responses (``stream=True``) are counted when issued; their
+    body bytes are added by the caller via ``add_bytes``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        headers: dict = None,
+        rate: float = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        self.name = name
+        self.timeout = timeout
+        self.limiter = TokenBucket(rate) if rate else None
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        if headers:
+            self.session.headers.update(headers)
+
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "failures": 0,
+            "bytes": 0,
+            "ttfb_total_s": 0.0,
+            "ttfb_max_s": 0.0,
+            "wait_total_s": 0.0,
+        }
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Rate-limited GET through the pooled session.
+
+        Accepts the same keyword arguments as ``requests.get``; ``timeout``
+        defaults to the client's. Retries and status handling stay with
+        the caller.
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        waited = 0.0
+        if self.limiter:
+            start = time.monotonic()
+            self.limiter.acquire()
+            waited = time.monotonic() - start
+        try:
+            resp = self.session.get(url, **kwargs)
+        except requests.RequestException:
+            with self._lock:
+                self._stats["failures"] += 1
+                self._stats["wait_total_s"] += waited
+            raise
+
+        ttfb = resp.elapsed.total_seconds()
+        size = 0
+        if not kwargs.get("stream"):
+            size = _wire_bytes(resp)
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bytes"] += size
+            self._stats["ttfb_total_s"] += ttfb
+            self._stats["ttfb_max_s"] = max(self._stats["ttfb_max_s"], ttfb)
+            self._stats["wait_total_s"] += waited
+        return resp
+
+    def add_bytes(self, n: int):
+        """Count body bytes read from a streamed response."""
+        with self._lock:
+            self._stats["bytes"] += n
+
+    def stats(self) -> dict:
+        """Snapshot of the counters, with mean time-to-first-byte."""
+        with self._lock:
+            s = dict(self._stats)
+        s["ttfb_mean_s"] = s["ttfb_total_s"] / s["requests"] if s["requests"] else 0.0
+        for k in ("ttfb_total_s", "ttfb_max_s", "ttfb_mean_s", "wait_total_s"):
+            s[k] = round(s[k], 4)
+        return {"client": self.name, **s}
+
+    def print_stats(self):
+        s = self.stats()
+        print(
+            f"HTTP [{s['client']}]: {s['requests']} requests, {s['failures']} failures, "
+            f"{s['bytes'] / 1024:.0f} KB, TTFB mean {s['ttfb_mean_s'] * 1000:.0f} ms "
+            f"(max {s['ttfb_max_s'] * 1000:.0f} ms), rate-limit wait {s['wait_total_s']:.1f} s",
+            file=sys.stderr,
+        )
+
+
+def _wire_bytes(resp: requests.Response) -> int:
+    """Bytes read off the socket for a fully-read response."""
+    body = resp.content  # forces the read
+    try:
+        wire = resp.raw.tell()
+    except (AttributeError, OSError, ValueError):
+        wire = 0
+    return wire or len(body)
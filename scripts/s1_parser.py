@@ -6,16 +6,48 @@ passages, and flag patterns.
 Usage:
     python scripts/s1_parser.py --action find_candidates --file s1_SLRN_2023-05-03.html
     python scripts/s1_parser.py --action extract_passages --file s1_SLRN_2023-05-03.html --nct NCT05355805
+    python scripts/s1_parser.py --action extract_passages --file s1_SLRN_2023-05-03.html --nct NCT05355805 \
+        --index s1_SLRN_2023-05-03.s1idx
+    python scripts/s1_parser.py --action find_candidates --file s1_SLRN_2023-05-03.html --cache-stats
+    python scripts/s1_parser.py --action find_candidates --file s1_SLRN_2023-05-03.html --no-cache
+    python scripts/s1_parser.py --action find_candidates --file archive:0001962918-23-000010
+    python scripts/s1_parser.py --action corpus --corpus filings/ --output candidates.jsonl --workers 8
+
+Parse results are cached by content hash under $S1_PARSER_CACHE_DIR
+(default ~/.cache/s1_checker/parse), bounded by $S1_PARSER_CACHE_MAX_MB.
 """
 
 import argparse
+import array
+import bisect
+import codecs
+import hashlib
+import itertools
 import json
+import marshal
+import multiprocessing
 import os
 import re
+import signal
 import sys
+import threading
+import time
+import zlib
 
 from bs4 import BeautifulSoup, Comment
 
+from filing_archive import ARCHIVE_PREFIX, open_filing, resolve_filing_path
+
+try:
+    from lxml import etree
+except ImportError:  # streaming engine unavailable; BeautifulSoup only
+    etree = None
+
+try:
+    import fcntl
+except ImportError:  # no cross-process stats lock on this platform
+    fcntl = None
+
 # ── Constants ─────────────────────────────────────────────────────────
 
 KNOWN_SECTIONS = [
@@ -149,8 +181,8 @@ def _classify_section(section_name: str) -> str:
 
 def _load_html(filepath: str) -> BeautifulSoup:
     """Load and parse S-1 HTML."""
-    with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-        html = f.read()
+    with open_filing(filepath) as f:
+        html = f.read().decode("utf-8", errors="replace")
     soup = BeautifulSoup(html, "lxml")
     # Strip non-content elements
     for tag in soup.find_all(["style", "script"]):
@@ -160,30 +192,56 @@ def _load_html(filepath: str) -> BeautifulSoup:
     return soup
 
 
-def _extract_sections(soup: BeautifulSoup) -> list[dict]:
-    """Break the document into sections based on anchor/bold headers.
+def _collect_headers(soup: BeautifulSoup) -> tuple[list[str], list[str]]:
+    """Collect candidate section-header texts from a parsed soup.
 
-    Returns list of {"name": str, "text": str, "char_offset": int}.
+    Returns (anchor_texts, bold_texts), both in document order: the text
+    of every <a name="..."> (or of its parent when inside <b>/<strong>),
+    and the text of every <b>/<strong> element.
     """
-    # Strategy: find all <a name="..."> inside <b>/<strong> tags,
-    # or standalone <b>/<strong> with text matching known sections.
-    sections = []
-    full_text = soup.get_text(separator="\n", strip=True)
-
-    # Find named anchors that are section headers
-    anchors = soup.find_all("a", attrs={"name": True})
-    section_markers = []  # (char_position_in_full_text, section_name)
-
-    for anchor in anchors:
+    anchor_texts = []
+    for anchor in soup.find_all("a", attrs={"name": True}):
         parent = anchor.parent
         if not parent:
             continue
         # Check if parent is <b> or <strong>
         tag_name = parent.name if parent.name else ""
         if tag_name in ("b", "strong") or anchor.find_parent(["b", "strong"]):
-            text = parent.get_text(strip=True)
+            anchor_texts.append(parent.get_text(strip=True))
         else:
-            text = anchor.get_text(strip=True)
+            anchor_texts.append(anchor.get_text(strip=True))
+    bold_texts = [b.get_text(strip=True) for b in soup.find_all(["b", "strong"])]
+    return anchor_texts, bold_texts
+
+
+def _extract_sections(soup: BeautifulSoup, full_text: str = None) -> list[dict]:
+    """Break the document into sections based on anchor/bold headers.
+
+    ``full_text`` is the soup's ``get_text(separator="\n", strip=True)``;
+    pass it when already computed to avoid a second walk over the DOM.
+
+    Returns list of {"name": str, "text": str, "char_offset": int}.
+    """
+    if full_text is None:
+        full_text = soup.get_text(separator="\n", strip=True)
+    anchor_texts, bold_texts = _collect_headers(soup)
+    return _sections_from_headers(full_text, anchor_texts, bold_texts)
+
+
+def _sections_from_headers(
+    full_text: str, anchor_texts: list[str], bold_texts: list[str]
+) -> list[dict]:
+    """Build sections from header texts, however they were collected.
+
+    Returns list of {"name": str, "text": str, "char_offset": int}.
+    """
+    # Strategy: find all <a name="..."> inside <b>/<strong> tags,
+    # or standalone <b>/<strong> with text matching known sections.
+    sections = []
+    section_markers = []  # (char_position_in_full_text, section_name)
+
+    # Named anchors that are section headers
+    for text in anchor_texts:
         if not text:
             continue
 
@@ -202,11 +260,11 @@ def _extract_sections(soup: BeautifulSoup) -> list[dict]:
                 section_markers.append((pos, matched_section))
 
     # Also search for bold text matching known sections (no anchor)
-    for bold in soup.find_all(["b", "strong"]):
-        text = bold.get_text(strip=True).upper()
+    for bold_text in bold_texts:
+        text = bold_text.upper()
         for known in KNOWN_SECTIONS:
             if known in text or text in known:
-                pos = full_text.find(bold.get_text(strip=True))
+                pos = full_text.find(bold_text)
                 if pos >= 0:
                     # Avoid duplicates
                     if not any(abs(p - pos) < 100 for p, _ in section_markers):
@@ -244,6 +302,216 @@ def _extract_sections(soup: BeautifulSoup) -> list[dict]:
     return sections
 
 
+PIPELINE_KEYWORDS = ("pipeline", "our programs")
+
+
+def _detect_pipeline_image(soup: BeautifulSoup) -> bool:
+    """Check for pipeline images in HTML — look near "pipeline" text."""
+    for img in soup.find_all("img"):
+        # Check surrounding context for "pipeline" keywords
+        parent = img.parent
+        while parent and parent.name not in ("body", "html", None):
+            parent_text = parent.get_text(strip=True).lower()[:500]
+            if any(kw in parent_text for kw in PIPELINE_KEYWORDS):
+                return True
+            parent = parent.parent
+    return False
+
+
+# ── Streaming HTML Extraction ─────────────────────────────────────────
+#
+# Large F-1s with embedded financial tables push a full BeautifulSoup
+# tree past 1 GB of RSS. The streaming engine feeds the file through
+# lxml's HTMLPullParser in chunks and discards each element once its
+# text has been emitted, so only the open-element path is held in
+# memory. It produces the same full text, header texts and pipeline
+# image flag as the soup path, which is kept as a fallback.
+
+STREAM_CHUNK_SIZE = 1 << 16
+_SKIP_TEXT_TAGS = {"script", "style"}
+_BOLD_TAGS = {"b", "strong"}
+
+
+def _iter_html_events(filepath: str, chunk_size: int = STREAM_CHUNK_SIZE):
+    """Stream an S-1 HTML file and yield extraction events in document order.
+
+    Events:
+        ("text", str)                 — one stripped, non-empty text node
+        ("anchor_header", seq, str)   — header text for an <a name="...">
+        ("bold_header", seq, str)     — text of a <b>/<strong> element
+        ("img", char_offset)          — an <img> at this full-text offset
+        ("img_context", str)          — lowercased first 500 chars of the
+                                        text of an element (below <body>)
+                                        that contains an <img>
+
+    ``seq`` is the element's start-tag order, so header events can be put
+    back into document order; they are emitted when their text is complete.
+    """
+    parser = etree.HTMLPullParser(
+        events=("start", "end", "comment", "pi"), huge_tree=True,
+    )
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+    pieces = []      # emitted text nodes, joined later by the consumer
+    text_len = [0]   # running length of "\n".join(pieces)
+    stack = []       # open-element frames: [elem, start_idx, seq, anchors, has_img]
+    seq = 0
+
+    def emit(text):
+        if text:
+            text = text.strip()
+            if text:
+                text_len[0] += len(text) + (1 if pieces else 0)
+                pieces.append(text)
+                return text
+        return None
+
+    def text_from(start_idx, limit=None):
+        if limit is None:
+            return "".join(pieces[start_idx:])
+        out = []
+        size = 0
+        for piece in itertools.islice(pieces, start_idx, None):
+            out.append(piece)
+            size += len(piece)
+            if size >= limit:
+                break
+        return "".join(out)
+
+    def preceding_text(elem):
+        # Text between the previous sibling (or parent start) and elem is
+        # complete once elem has started; the finished sibling is dropped.
+        # Top-level siblings of the root (an <?xml?> declaration, a leading
+        # Wdesk comment, a comment after </html>) have no parent to drop
+        # them from and are kept.
+        prev = elem.getprevious()
+        parent = elem.getparent()
+        if prev is not None:
+            text = emit(prev.tail)
+            if parent is not None:
+                parent.remove(prev)
+            return text
+        return emit(parent.text) if parent is not None else None
+
+    def handle(event, elem):
+        nonlocal seq
+        if event in ("comment", "pi"):
+            text = preceding_text(elem)
+            if text:
+                yield ("text", text)
+            return
+        if event == "start":
+            text = preceding_text(elem)
+            if text:
+                yield ("text", text)
+            tag = elem.tag if isinstance(elem.tag, str) else ""
+            if tag == "img":
+                yield ("img", text_len[0])
+                if stack:
+                    stack[-1][4] = True
+            stack.append([elem, len(pieces), seq, [], False])
+            seq += 1
+            return
+
+        # end
+        if len(elem):
+            text = emit(elem[-1].tail)
+            del elem[:]
+        elif not (isinstance(elem.tag, str) and elem.tag in _SKIP_TEXT_TAGS):
+            text = emit(elem.text)
+        else:
+            text = None
+        if text:
+            yield ("text", text)
+
+        frame = stack.pop()
+        _, start_idx, elem_seq, anchor_seqs, has_img = frame
+        tag = elem.tag if isinstance(elem.tag, str) else ""
+
+        if anchor_seqs:
+            parent_text = text_from(start_idx)
+            for anchor_seq in anchor_seqs:
+                yield ("anchor_header", anchor_seq, parent_text)
+        if tag in _BOLD_TAGS:
+            yield ("bold_header", elem_seq, text_from(start_idx))
+        if tag == "a" and "name" in elem.attrib:
+            if stack and any(f[0].tag in _BOLD_TAGS for f in stack):
+                # Header text is the parent's, which is not finished yet
+                stack[-1][3].append(elem_seq)
+            elif stack:
+                yield ("anchor_header", elem_seq, text_from(start_idx))
+        if has_img:
+            if tag not in ("body", "html"):
+                yield ("img_context", text_from(start_idx, 500).lower()[:500])
+            if stack:
+                stack[-1][4] = True
+
+    with open_filing(filepath) as f:
+        while True:
+            chunk = f.read(chunk_size)
+            final = not chunk
+            data = decoder.decode(chunk, final=final)
+            if final:
+                parser.close()
+            elif data:
+                parser.feed(data)
+            for event, elem in parser.read_events():
+                yield from handle(event, elem)
+            if final:
+                break
+
+
+def _stream_extract(filepath: str) -> dict:
+    """Run the streaming engine and fold its events into parse results.
+
+    Returns {"full_text", "sections", "pipeline_is_image"} matching what
+    the BeautifulSoup path derives from the same file, including files
+    wrapped in a leading declaration or comment and a trailing comment:
+
+        >>> import os, tempfile
+        >>> html = ('<?xml version="1.0"?><!-- Document created using Wdesk -->'
+        ...         '<html><body><p><a name="s1"></a><b>Prospectus Summary</b></p>'
+        ...         '<p>Our lead candidate is ABC-101.</p></body></html><!-- end -->')
+        >>> fd, path = tempfile.mkstemp(suffix=".htm")
+        >>> _ = os.write(fd, html.encode()); os.close(fd)
+        >>> streamed = _stream_extract(path)
+        >>> streamed["full_text"]
+        'Prospectus Summary\\nOur lead candidate is ABC-101.'
+        >>> soup = ParsedDocument.from_soup(_load_html(path))
+        >>> (streamed["full_text"], streamed["sections"]) == (soup.full_text, soup.sections)
+        True
+        >>> os.remove(path)
+    """
+    pieces = []
+    anchor_headers = []
+    bold_headers = []
+    pipeline_is_image = False
+    for event in _iter_html_events(filepath):
+        kind = event[0]
+        if kind == "text":
+            pieces.append(event[1])
+        elif kind == "anchor_header":
+            anchor_headers.append((event[1], event[2]))
+        elif kind == "bold_header":
+            bold_headers.append((event[1], event[2]))
+        elif kind == "img_context" and not pipeline_is_image:
+            pipeline_is_image = any(kw in event[1] for kw in PIPELINE_KEYWORDS)
+
+    full_text = "\n".join(pieces)
+    anchor_headers.sort(key=lambda h: h[0])
+    bold_headers.sort(key=lambda h: h[0])
+    sections = _sections_from_headers(
+        full_text,
+        [text for _, text in anchor_headers],
+        [text for _, text in bold_headers],
+    )
+    return {
+        "full_text": full_text,
+        "sections": sections,
+        "pipeline_is_image": pipeline_is_image,
+    }
+
+
 def _approx_page(char_offset: int) -> int:
     """Approximate page number from character offset."""
     return max(1, char_offset // CHARS_PER_PAGE + 1)
@@ -251,11 +519,96 @@ def _approx_page(char_offset: int) -> int:
 
 # ── Candidate Detection ──────────────────────────────────────────────
 
-def _find_candidate_names(full_text: str) -> list[dict]:
+# Context cues that mark an INN-suffix word as a likely drug candidate
+CANDIDATE_CONTEXT_PATTERNS = [
+    r"candidate", r"product\s+candidate", r"investigational", r"our\s+lead",
+    r"our\s+pipeline", r"clinical\s+trial", r"development\s+candidate",
+    r"drug\s+candidate", r"therapeutic", r"antibody", r"inhibitor",
+    r"treatment\s+of", r"patients?\s+with",
+]
+CANDIDATE_CONTEXT_RE = re.compile(
+    "(?:" + "|".join(CANDIDATE_CONTEXT_PATTERNS) + ")", re.IGNORECASE
+)
+
+INN_WORD_RE = re.compile(r"\b[a-z]{5,}\b", re.IGNORECASE)
+DESIGNATOR_TOKEN_RE = re.compile(r"\b[a-z]{2,5}-\d{3,5}\b", re.IGNORECASE)
+
+DESIGNATOR_SKIP_PREFIXES = ("SEC-", "ASC-", "IRS-", "No-", "EX-", "FY-", "DTC-")
+
+
+class _CueSpans:
+    """Sorted spans of every match of a list of alternative cue patterns.
+
+    Each alternative is matched on its own so overlapping cues (e.g. "our
+    product" and "product candidate") are all recorded, which makes
+    ``within(lo, hi)`` equivalent to running the combined regex's
+    ``search`` on ``text[lo:hi]``.
+    """
+
+    def __init__(self, patterns: list[str], text: str, flags: int = re.IGNORECASE):
+        spans = []
+        for pat in patterns:
+            # A trailing quantifier must match minimally, as it would
+            # when the window cuts the text right after it.
+            if pat.endswith("+"):
+                pat += "?"
+            spans.extend(m.span() for m in re.finditer(pat, text, flags))
+        spans.sort()
+        self._starts = [s for s, _ in spans]
+        self._ends = [e for _, e in spans]
+
+    def within(self, lo: int, hi: int) -> bool:
+        """True if some cue match lies entirely inside text[lo:hi]."""
+        i = bisect.bisect_left(self._starts, lo)
+        while i < len(self._starts) and self._starts[i] < hi:
+            if self._ends[i] <= hi:
+                return True
+            i += 1
+        return False
+
+
+class CandidateScan:
+    """Single-pass index for candidate-name detection and ownership scoring.
+
+    Tokenizes the full text once, recording the offsets of every 5+ letter
+    word and every designator-shaped token (keyed in lowercase), and the
+    spans of every candidate-context, ownership and competitor cue. A
+    candidate's context test and ownership score then become window
+    lookups over sorted offsets instead of fresh regex scans of the text.
+    """
+
+    def __init__(self, full_text: str):
+        self.text = full_text
+        self.words = {}        # lowercase word -> [(start, end)] in text order
+        for m in INN_WORD_RE.finditer(full_text):
+            self.words.setdefault(m.group().lower(), []).append(m.span())
+        self.designators = {}  # lowercase designator -> [(start, end)]
+        for m in DESIGNATOR_TOKEN_RE.finditer(full_text):
+            self.designators.setdefault(m.group().lower(), []).append(m.span())
+        self.context_cues = _CueSpans(CANDIDATE_CONTEXT_PATTERNS, full_text)
+        self.ownership_cues = _CueSpans(OWNERSHIP_PATTERNS, full_text)
+        self.competitor_cues = _CueSpans(COMPETITOR_PATTERNS, full_text)
+
+    def occurrences(self, name: str) -> list[tuple[int, int]]:
+        """Offsets of every case-insensitive, word-bounded use of ``name``."""
+        key = name.lower()
+        if key in self.words:
+            return self.words[key]
+        if key in self.designators:
+            return self.designators[key]
+        if INN_WORD_RE.fullmatch(name) or DESIGNATOR_TOKEN_RE.fullmatch(name):
+            return []
+        pattern = re.compile(rf"\b{re.escape(name)}\b", re.IGNORECASE)
+        return [m.span() for m in pattern.finditer(self.text)]
+
+
+def _find_candidate_names(full_text: str, scan: CandidateScan = None) -> list[dict]:
     """Detect drug candidate names from text patterns.
 
     Returns list of {"name": str, "type": "inn"|"designator"}.
     """
+    if scan is None:
+        scan = CandidateScan(full_text)
     candidates = []
     seen = set()
 
@@ -264,68 +617,109 @@ def _find_candidate_names(full_text: str) -> list[dict]:
         name = m.group()
         if name not in seen:
             # Filter out common non-drug designators
-            skip_prefixes = ("SEC-", "ASC-", "IRS-", "No-", "EX-",
-                             "FY-", "DTC-")
-            if not any(name.startswith(p) for p in skip_prefixes):
+            if not any(name.startswith(p) for p in DESIGNATOR_SKIP_PREFIXES):
                 seen.add(name)
                 candidates.append({"name": name, "type": "designator"})
 
     # 2. INN-style names: look for words ending in INN suffixes that
     #    appear near candidate-indicating context and are not common words
-    words = set(re.findall(r"\b[a-z]{5,}\b", full_text.lower()))
-    candidate_context_re = re.compile(
-        r"(?:candidate|product\s+candidate|investigational|our\s+lead"
-        r"|our\s+pipeline|clinical\s+trial|development\s+candidate"
-        r"|drug\s+candidate|therapeutic|antibody|inhibitor"
-        r"|treatment\s+of|patients?\s+with)",
-        re.IGNORECASE,
-    )
-    for word in words:
-        if word in INN_BLOCKLIST:
+    text_len = len(full_text)
+    for word, spans in scan.words.items():
+        if word in INN_BLOCKLIST or word in seen:
             continue
-        if any(word.endswith(suf) for suf in INN_SUFFIXES):
-            if word not in seen:
-                # Verify it appears near candidate context (within 300 chars)
-                pattern = re.compile(
-                    rf"\b{re.escape(word)}\b", re.IGNORECASE
-                )
-                for m in pattern.finditer(full_text):
-                    start = max(0, m.start() - 300)
-                    end = min(len(full_text), m.end() + 300)
-                    context = full_text[start:end]
-                    if candidate_context_re.search(context):
-                        seen.add(word)
-                        candidates.append({"name": word, "type": "inn"})
-                        break
+        if not word.endswith(INN_SUFFIXES):
+            continue
+        # Verify it appears near candidate context (within 300 chars)
+        for start, end in spans:
+            if scan.context_cues.within(max(0, start - 300), min(text_len, end + 300)):
+                seen.add(word)
+                candidates.append({"name": word, "type": "inn"})
+                break
 
     return candidates
 
 
 def _extract_passages_for_name(
-    name: str, sections: list[dict], max_context: int = 800
+    name: str, sections: list[dict], max_context: int = 800,
+    doc: "ParsedDocument" = None,
 ) -> list[dict]:
-    """Find all passages mentioning a name across sections."""
+    """Find all passages mentioning a name across sections.
+
+    With ``doc``, name occurrences come from the document's positional
+    index instead of a regex scan of every section.
+    """
+    if doc is not None:
+        return _deduplicate_passages([
+            _make_passage(section, rel_start, rel_end, max_context)
+            for section, rel_start, rel_end in doc.section_occurrences(name)
+        ])
     passages = []
     pattern = re.compile(rf"\b{re.escape(name)}\b", re.IGNORECASE)
     for section in sections:
-        text = section["text"]
-        for m in pattern.finditer(text):
-            # Extract surrounding context (paragraph-level)
-            start = max(0, m.start() - max_context // 2)
-            end = min(len(text), m.end() + max_context // 2)
-            # Snap to sentence/paragraph boundaries
-            snippet = text[start:end].strip()
-            char_offset = section["char_offset"] + m.start()
-            passages.append({
-                "section": section["name"],
-                "page_approx": _approx_page(char_offset),
-                "text": snippet,
-                "char_offset": char_offset,
-            })
+        for m in pattern.finditer(section["text"]):
+            passages.append(_make_passage(section, m.start(), m.end(), max_context))
     # De-duplicate overlapping passages
     return _deduplicate_passages(passages)
 
 
+ALIAS_PAREN_RE = re.compile(r"\s*\(([^)]+)\)")
+ALIAS_KNOWN_AS_RE = re.compile(
+    r"[,\s]+(?:also|formerly|previously)\s+known\s+as\s+(\S+)", re.IGNORECASE
+)
+
+
+def _alias_texts(name: str, index: "TextIndex") -> list[str]:
+    """Return text that may name an alias of ``name``, in report order.
+
+    Covers "izokibep (SLRN-801)", "(izokibep)" and "izokibep, also known
+    as X". Each pattern is anchored at the name's indexed occurrences
+    rather than scanned across the whole text.
+    """
+    text = index.text
+    spans = index.find(name, overlapping=True)
+    aliases = []
+    # "izokibep (SLRN-801)" or "SLRN-801 (izokibep)"
+    last_end = -1
+    for start, end in spans:
+        if start < last_end:
+            continue
+        m = ALIAS_PAREN_RE.match(text, end)
+        if m:
+            aliases.append(m.group(1).strip())
+            last_end = m.end()
+    # "(izokibep)"
+    for start, end in spans:
+        if text[start - 1:start] == "(" and text[end:end + 1] == ")":
+            aliases.append(text[start:end])
+    # "name, also known as X" / "name, formerly known as X"
+    last_end = -1
+    for start, end in spans:
+        if start < last_end:
+            continue
+        m = ALIAS_KNOWN_AS_RE.match(text, end)
+        if m:
+            aliases.append(m.group(1).strip())
+            last_end = m.end()
+    return aliases
+
+
+def _make_passage(section: dict, rel_start: int, rel_end: int, max_context: int) -> dict:
+    """Build the passage dict for a match at [rel_start, rel_end) in a section."""
+    text = section["text"]
+    # Extract surrounding context (paragraph-level)
+    start = max(0, rel_start - max_context // 2)
+    end = min(len(text), rel_end + max_context // 2)
+    # Snap to sentence/paragraph boundaries
+    snippet = text[start:end].strip()
+    char_offset = section["char_offset"] + rel_start
+    return {
+        "section": section["name"],
+        "page_approx": _approx_page(char_offset),
+        "text": snippet,
+        "char_offset": char_offset,
+    }
+
+
 def _deduplicate_passages(passages: list[dict]) -> list[dict]:
     """Remove passages that substantially overlap."""
     if not passages:
@@ -346,12 +740,14 @@ def _deduplicate_passages(passages: list[dict]) -> list[dict]:
 
 # ── Flag Detection ────────────────────────────────────────────────────
 
-def _load_red_flag_phrases() -> list[str]:
+RED_FLAG_PHRASES_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "reference", "red_flag_phrases.txt",
+)
+
+
+def _load_red_flag_phrases(ref_path: str = RED_FLAG_PHRASES_PATH) -> list[str]:
     """Load red flag phrases from reference file."""
-    ref_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        "reference", "red_flag_phrases.txt",
-    )
     if not os.path.exists(ref_path):
         # Default list if file doesn't exist yet
         return [
@@ -367,7 +763,9 @@ def _load_red_flag_phrases() -> list[str]:
         return [line.strip() for line in f if line.strip()]
 
 
-def _load_red_flag_phrases_tiered() -> dict[str, list[str]]:
+def _load_red_flag_phrases_tiered(
+    ref_path: str = RED_FLAG_PHRASES_PATH,
+) -> dict[str, list[str]]:
     """Load red flag phrases organized by tier from reference file.
 
     The file uses ## headers to separate tiers:
@@ -377,10 +775,6 @@ def _load_red_flag_phrases_tiered() -> dict[str, list[str]]:
 
     Returns: {"tier_1": [...], "tier_2": [...], "tier_3": [...]}
     """
-    ref_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        "reference", "red_flag_phrases.txt",
-    )
     tiers = {"tier_1": [], "tier_2": [], "tier_3": []}
     current_tier = None
 
@@ -404,6 +798,25 @@ def _load_red_flag_phrases_tiered() -> dict[str, list[str]]:
     return tiers
 
 
+# Context markers for red flag classification
+RED_FLAG_CAUTIONARY_MARKERS = [
+    "may not be", "cannot assure", "no guarantee", "no assurance",
+    "there can be no", "we cannot predict", "risks include",
+    "we may not", "there is no certainty",
+]
+RED_FLAG_CAUTIONARY_RE = re.compile(
+    "|".join(re.escape(m) for m in RED_FLAG_CAUTIONARY_MARKERS)
+)
+RED_FLAG_DATA_RE = re.compile(
+    r"\b\d+(?:\.\d+)?%|\bp\s*[=<>]\s*\d|"
+    r"\bN\s*=\s*\d|\bn\s*=\s*\d|\b\d+\s*(?:of|/)\s*\d+\s*(?:patients?|subjects?)|"
+    r"\bAE\b|\bSAE\b|\badverse\s+event|"
+    r"\bdose[- ]?(?:limiting|response)|"
+    r"\bGrade\s+[1-5]",
+    re.IGNORECASE,
+)
+
+
 def classify_red_flag_tier(phrase_match: str, context_window: str, section: str = "") -> dict:
     """Classify a red flag phrase hit by tier and context.
 
@@ -420,53 +833,28 @@ def classify_red_flag_tier(phrase_match: str, context_window: str, section: str
         "section": str
     }
     """
-    tiers = _load_red_flag_phrases_tiered()
-    phrase_lower = phrase_match.lower().strip()
-
-    # Determine tier
-    tier = 0
-    for t1_phrase in tiers["tier_1"]:
-        if t1_phrase.lower() in phrase_lower or phrase_lower in t1_phrase.lower():
-            tier = 1
-            break
-    if tier == 0:
-        for t2_phrase in tiers["tier_2"]:
-            if t2_phrase.lower() in phrase_lower or phrase_lower in t2_phrase.lower():
-                tier = 2
-                break
-    if tier == 0:
-        for t3_phrase in tiers["tier_3"]:
-            if t3_phrase.lower() in phrase_lower or phrase_lower in t3_phrase.lower():
-                tier = 3
-                break
-    if tier == 0:
-        tier = 1  # default to most conservative
+    return {
+        "phrase": phrase_match,
+        "tier": _RED_FLAG_REGISTRY.tier_of(phrase_match),
+        **_classify_red_flag_context(context_window, section),
+    }
 
-    # Determine context type
-    context_lower = context_window.lower()
+
+def _classify_red_flag_context(context_window: str, section: str = "") -> dict:
+    """Determine the context type of a red flag hit, independent of its tier.
+
+    Returns: {"context_type": str, "nearby_data": bool, "section": str}
+    """
     section_upper = section.upper() if section else ""
 
     # Check if cautionary (in Risk Factors or conditional language)
-    cautionary_markers = [
-        "may not be", "cannot assure", "no guarantee", "no assurance",
-        "there can be no", "we cannot predict", "risks include",
-        "we may not", "there is no certainty",
-    ]
     is_cautionary = (
         "RISK FACTORS" in section_upper
-        or any(marker in context_lower for marker in cautionary_markers)
+        or RED_FLAG_CAUTIONARY_RE.search(context_window.lower()) is not None
     )
 
     # Check if supported by nearby quantitative data
-    data_patterns = re.compile(
-        r"\b\d+(?:\.\d+)?%|\bp\s*[=<>]\s*\d|"
-        r"\bN\s*=\s*\d|\bn\s*=\s*\d|\b\d+\s*(?:of|/)\s*\d+\s*(?:patients?|subjects?)|"
-        r"\bAE\b|\bSAE\b|\badverse\s+event|"
-        r"\bdose[- ]?(?:limiting|response)|"
-        r"\bGrade\s+[1-5]",
-        re.IGNORECASE,
-    )
-    has_nearby_data = bool(data_patterns.search(context_window))
+    has_nearby_data = RED_FLAG_DATA_RE.search(context_window) is not None
 
     if is_cautionary:
         context_type = "CAUTIONARY"
@@ -476,37 +864,230 @@ def classify_red_flag_tier(phrase_match: str, context_window: str, section: str
         context_type = "STANDALONE"
 
     return {
-        "phrase": phrase_match,
-        "tier": tier,
         "context_type": context_type,
         "nearby_data": has_nearby_data,
         "section": section,
     }
 
 
+# Characters that mark a phrase-file entry as a regex pattern
+# (e.g. "demonstrated that .* was well tolerated") rather than a literal.
+_PHRASE_REGEX_META = re.compile(r"[*+?()\[\]{}|\\]")
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+class RedFlagScanner:
+    """Single-pass multi-phrase matcher for the red flag phrase list.
+
+    All literal phrases are compiled into one zero-width lookahead
+    alternation, longest first, so the regex engine makes one pass over
+    the text and reports the longest phrase starting at each position.
+    Shorter phrases that are word-bounded prefixes of a matched phrase
+    ("safe" inside "safe and effective") are derived from a table built
+    up front, so overlapping hits are still reported. Regex-style entries
+    are matched separately with ``.*`` made non-greedy.
+    """
+
+    def __init__(self, tiers: dict[str, list[str]]):
+        self.phrases = []       # file order: [(phrase, tier)]
+        literal_index = {}      # lowercase phrase -> index into self.phrases
+        self._regex_entries = []  # [(index, compiled pattern)]
+        for tier_key in ("tier_1", "tier_2", "tier_3"):
+            tier = int(tier_key[-1])
+            for phrase in tiers.get(tier_key, []):
+                key = phrase.lower()
+                if key in literal_index:
+                    continue
+                index = len(self.phrases)
+                self.phrases.append((phrase, tier))
+                if _PHRASE_REGEX_META.search(phrase):
+                    pattern = phrase.replace(".*", ".*?").replace(".+", ".+?")
+                    try:
+                        compiled = re.compile(rf"\b{pattern}\b", re.IGNORECASE)
+                    except re.error:
+                        compiled = re.compile(rf"\b{re.escape(phrase)}\b", re.IGNORECASE)
+                    self._regex_entries.append((index, compiled))
+                else:
+                    literal_index[key] = index
+        self._literal_index = literal_index
+
+        # Word-bounded prefixes: phrase index -> indexes of shorter phrases
+        # that must also match wherever this phrase matches.
+        self._prefixes = {}
+        for key, index in literal_index.items():
+            prefixes = []
+            for other, other_index in literal_index.items():
+                if (other_index != index and len(other) < len(key)
+                        and key.startswith(other)
+                        and _is_word_char(key[len(other) - 1])
+                        != _is_word_char(key[len(other)])):
+                    prefixes.append(other_index)
+            self._prefixes[index] = prefixes
+
+        alternation = "|".join(
+            re.escape(k) for k in sorted(literal_index, key=len, reverse=True)
+        )
+        self._literal_re = (
+            re.compile(rf"(?=\b({alternation})\b)", re.IGNORECASE)
+            if alternation else None
+        )
+
+    def scan(self, text: str) -> list[dict]:
+        """Return every hit as {"phrase", "tier", "position", "end", "order"}.
+
+        Hits are sorted by position. Like a per-phrase ``finditer``,
+        repeated hits of one phrase never overlap each other.
+        """
+        hits = []
+        last_end = {}
+
+        def add(index, start, end):
+            if start < last_end.get(index, -1):
+                return
+            last_end[index] = end
+            phrase, tier = self.phrases[index]
+            hits.append({"phrase": phrase, "tier": tier, "position": start,
+                         "end": end, "order": index})
+
+        if self._literal_re is not None:
+            for m in self._literal_re.finditer(text):
+                start = m.start()
+                matched = m.group(1)
+                index = self._literal_index[matched.lower()]
+                add(index, start, start + len(matched))
+                for prefix_index in self._prefixes[index]:
+                    add(prefix_index, start,
+                        start + len(self.phrases[prefix_index][0]))
+        for index, pattern in self._regex_entries:
+            for m in pattern.finditer(text):
+                add(index, m.start(), m.end())
+
+        hits.sort(key=lambda h: (h["position"], h["order"]))
+        return hits
+
+
+class RedFlagRegistry:
+    """Process-wide cache of the tiered red flag phrase list.
+
+    Loads reference/red_flag_phrases.txt once, indexes phrases by tier and
+    owns the RedFlagScanner built from them. Every access checks the
+    file's mtime, so a long-running worker picks up edits to the phrase
+    list without a restart.
+    """
+
+    def __init__(self, path: str = RED_FLAG_PHRASES_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._loaded = False
+        self._tiers = {"tier_1": [], "tier_2": [], "tier_3": []}
+        self._tier_lookup = {}   # lowercase phrase -> declared tier
+        self._fuzzy_cache = {}   # lowercase phrase text -> resolved tier
+        self._scanner = None
+        self._digest = ""
+
+    def _refresh(self):
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            mtime = None
+        if self._loaded and mtime == self._mtime:
+            return
+        with self._lock:
+            if self._loaded and mtime == self._mtime:
+                return
+            tiers = _load_red_flag_phrases_tiered(self.path)
+            if not any(tiers.values()):
+                # No tiered file: fall back to the default list, all tier 1
+                tiers = {"tier_1": _load_red_flag_phrases(self.path),
+                         "tier_2": [], "tier_3": []}
+            tier_lookup = {}
+            for tier_key in ("tier_1", "tier_2", "tier_3"):
+                for phrase in tiers[tier_key]:
+                    tier_lookup.setdefault(phrase.lower(), int(tier_key[-1]))
+            self._tiers = tiers
+            self._tier_lookup = tier_lookup
+            self._fuzzy_cache = {}
+            self._scanner = RedFlagScanner(tiers)
+            self._digest = hashlib.sha256(
+                json.dumps(tiers, sort_keys=True).encode("utf-8")
+            ).hexdigest()
+            self._mtime = mtime
+            self._loaded = True
+
+    @property
+    def tiers(self) -> dict[str, list[str]]:
+        """{"tier_1": [...], "tier_2": [...], "tier_3": [...]}"""
+        self._refresh()
+        return self._tiers
+
+    @property
+    def scanner(self) -> RedFlagScanner:
+        self._refresh()
+        return self._scanner
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 of the loaded phrase tiers, for cache fingerprints."""
+        self._refresh()
+        return self._digest
+
+    def tier_of(self, phrase_match: str) -> int:
+        """Return the tier (1-3) for a phrase or matched phrase text.
+
+        Phrases listed in the file resolve to their declared tier. Other
+        text falls back to substring matching against each tier in order,
+        defaulting to tier 1 (most conservative); those results are cached.
+        """
+        self._refresh()
+        phrase_lower = phrase_match.lower().strip()
+        tier = self._tier_lookup.get(phrase_lower)
+        if tier is not None:
+            return tier
+        tier = self._fuzzy_cache.get(phrase_lower)
+        if tier is not None:
+            return tier
+        tier = 1  # default to most conservative
+        for tier_key in ("tier_1", "tier_2", "tier_3"):
+            if any(p.lower() in phrase_lower or phrase_lower in p.lower()
+                   for p in self._tiers[tier_key]):
+                tier = int(tier_key[-1])
+                break
+        self._fuzzy_cache[phrase_lower] = tier
+        return tier
+
+
+_RED_FLAG_REGISTRY = RedFlagRegistry()
+
+
 def _scan_red_flags(text: str, section: str = "") -> list[dict]:
-    """Scan text for red flag phrases. Returns matches with context and tier."""
-    phrases = _load_red_flag_phrases()
+    """Scan text for red flag phrases. Returns matches with context and tier.
+
+    Hits are ordered by phrase (phrase-file order), then position.
+    """
     hits = []
-    for phrase in phrases:
-        pattern = re.compile(rf"\b{re.escape(phrase)}\b", re.IGNORECASE)
-        for m in pattern.finditer(text):
-            start = max(0, m.start() - 150)
-            end = min(len(text), m.end() + 150)
-            context = text[start:end].strip()
-            # Extended context for tier classification
-            ext_start = max(0, m.start() - 250)
-            ext_end = min(len(text), m.end() + 250)
-            ext_context = text[ext_start:ext_end].strip()
-            tier_info = classify_red_flag_tier(phrase, ext_context, section)
-            hits.append({
-                "phrase": phrase,
-                "context": context,
-                "position": m.start(),
-                "tier": tier_info["tier"],
-                "context_type": tier_info["context_type"],
-                "nearby_data": tier_info["nearby_data"],
-            })
+    scan_hits = _RED_FLAG_REGISTRY.scanner.scan(text)
+    scan_hits.sort(key=lambda h: (h["order"], h["position"]))
+    for h in scan_hits:
+        start = max(0, h["position"] - 150)
+        end = min(len(text), h["end"] + 150)
+        context = text[start:end].strip()
+        # Extended context for context classification
+        ext_start = max(0, h["position"] - 250)
+        ext_end = min(len(text), h["end"] + 250)
+        ext_context = text[ext_start:ext_end].strip()
+        context_info = _classify_red_flag_context(ext_context, section)
+        hits.append({
+            "phrase": h["phrase"],
+            "context": context,
+            "position": h["position"],
+            "tier": h["tier"],
+            "context_type": context_info["context_type"],
+            "nearby_data": context_info["nearby_data"],
+        })
     return hits
 
 
@@ -555,38 +1136,40 @@ def _scan_combined_phases(text: str) -> list[dict]:
 
 # ── Ownership Scoring ─────────────────────────────────────────────────
 
-OWNERSHIP_RE = re.compile(
-    r"(?:our\s+(?:lead|pipeline|product|candidate|program|drug)|"
-    r"we\s+are\s+(?:developing|advancing|evaluating|conducting)|"
-    r"we\s+initiated|we\s+plan\s+to|we\s+have\s+(?:developed|designed|initiated)|"
-    r"our\s+proprietary|our\s+(?:first|second|third)\s+|"
-    r"product\s+candidate)",
-    re.IGNORECASE,
-)
+OWNERSHIP_PATTERNS = [
+    r"our\s+(?:lead|pipeline|product|candidate|program|drug)",
+    r"we\s+are\s+(?:developing|advancing|evaluating|conducting)",
+    r"we\s+initiated", r"we\s+plan\s+to",
+    r"we\s+have\s+(?:developed|designed|initiated)",
+    r"our\s+proprietary", r"our\s+(?:first|second|third)\s+",
+    r"product\s+candidate",
+]
+OWNERSHIP_RE = re.compile("(?:" + "|".join(OWNERSHIP_PATTERNS) + ")", re.IGNORECASE)
 
-COMPETITOR_RE = re.compile(
-    r"(?:approved\s+by\s+(?:the\s+)?FDA|FDA[\s-]+approved|approved\s+for|"
-    r"commercially\s+available|currently\s+marketed|marketed\s+by|"
-    r"sold\s+under|competing\s+product|competitor|"
-    r"is\s+(?:an?\s+)?(?:approved|marketed)|only\s+(?:approved|FDA))",
-    re.IGNORECASE,
-)
+COMPETITOR_PATTERNS = [
+    r"approved\s+by\s+(?:the\s+)?FDA", r"FDA[\s-]+approved", r"approved\s+for",
+    r"commercially\s+available", r"currently\s+marketed", r"marketed\s+by",
+    r"sold\s+under", r"competing\s+product", r"competitor",
+    r"is\s+(?:an?\s+)?(?:approved|marketed)", r"only\s+(?:approved|FDA)",
+]
+COMPETITOR_RE = re.compile("(?:" + "|".join(COMPETITOR_PATTERNS) + ")", re.IGNORECASE)
 
 
-def _score_ownership(name: str, full_text: str) -> float:
+def _score_ownership(name: str, full_text: str, scan: CandidateScan = None) -> float:
     """Score 0-1 how likely this is the company's OWN candidate vs a comparator."""
-    pattern = re.compile(rf"\b{re.escape(name)}\b", re.IGNORECASE)
+    if scan is None:
+        scan = CandidateScan(full_text)
     own_hits = 0
     comp_hits = 0
     total = 0
-    for m in pattern.finditer(full_text):
+    text_len = len(full_text)
+    for m_start, m_end in scan.occurrences(name):
         total += 1
-        start = max(0, m.start() - 200)
-        end = min(len(full_text), m.end() + 200)
-        context = full_text[start:end]
-        if OWNERSHIP_RE.search(context):
+        start = max(0, m_start - 200)
+        end = min(text_len, m_end + 200)
+        if scan.ownership_cues.within(start, end):
             own_hits += 1
-        if COMPETITOR_RE.search(context):
+        if scan.competitor_cues.within(start, end):
             comp_hits += 1
     if total == 0:
         return 0.0
@@ -601,25 +1184,592 @@ def _normalize_text(text: str) -> str:
     return text
 
 
+PHASE_NEWLINE_RE = re.compile(r"(Phase)\s*\n\s*(\d)")
+
+
+def _normalize_with_offsets(text: str) -> tuple[str, list[int], list[int]]:
+    """Normalize ``text`` like _normalize_text, recording where offsets shift.
+
+    Returns (normalized_text, norm_breaks, raw_breaks): parallel sorted lists
+    such that from norm_breaks[i] onward a normalized offset maps to
+    raw_breaks[i] + (offset - norm_breaks[i]) in the raw text.
+    """
+    text = text.replace("\xa0", " ")
+    norm_breaks = [0]
+    raw_breaks = [0]
+    pieces = []
+    last = 0
+    norm_pos = 0
+    for m in PHASE_NEWLINE_RE.finditer(text):
+        pieces.append(text[last:m.start()])
+        norm_pos += m.start() - last
+        replacement = f"{m.group(1)} {m.group(2)}"
+        pieces.append(replacement)
+        norm_pos += len(replacement)
+        last = m.end()
+        # Everything after the replacement realigns with the raw text
+        norm_breaks.append(norm_pos)
+        raw_breaks.append(m.end())
+    pieces.append(text[last:])
+    return "".join(pieces), norm_breaks, raw_breaks
+
+
+# ── Positional Index ──────────────────────────────────────────────────
+
+TOKEN_RE = re.compile(r"\w+")
+INDEX_FORMAT_VERSION = 2  # 2: offsets into the original, not lowercased, text
+_POSTING_TYPECODE = "I" if array.array("I").itemsize == 4 else "L"
+
+
+class TextIndex:
+    """Positional inverted index over a document's normalized text.
+
+    Maps every ``\\w+`` token, lowercased, to the sorted start offsets of
+    its occurrences in the original text. Tokens are found before
+    lowercasing, since lowercasing can change the text's length ("İ"
+    becomes two characters) and would shift every later offset. Postings
+    are stored as packed arrays, so an index can be written to disk and
+    reloaded without re-tokenizing the text.
+    """
+
+    def __init__(self, text: str, postings: dict = None):
+        self.text = text
+        if postings is None:
+            postings = {}
+            for m in TOKEN_RE.finditer(text):
+                token = m.group().lower()
+                starts = postings.get(token)
+                if starts is None:
+                    postings[token] = [m.start()]
+                else:
+                    starts.append(m.start())
+        self._postings = postings  # token -> list[int] | packed bytes
+
+    def starts(self, token: str) -> list[int]:
+        """Start offsets of a single token (lowercase)."""
+        starts = self._postings.get(token, [])
+        if isinstance(starts, bytes):
+            packed = array.array(_POSTING_TYPECODE)
+            packed.frombytes(starts)
+            starts = packed.tolist()
+            self._postings[token] = starts
+        return starts
+
+    def find(self, name: str, overlapping: bool = False) -> list[tuple[int, int]]:
+        """Spans of every case-insensitive, word-bounded use of ``name``.
+
+        Same hits as ``re.finditer(rf"\\b{re.escape(name)}\\b", text,
+        re.IGNORECASE)``; multi-token names ("SLRN-801") are resolved from
+        the postings of their first token. With ``overlapping``, uses that
+        overlap an earlier one (possible for names like "AB-AB") are kept.
+
+            >>> TextIndex("İstanbul site; SLRN-801 and slrn-801x").find("SLRN-801")
+            [(15, 23)]
+        """
+        raw_parts = TOKEN_RE.findall(name)
+        parts = [part.lower() for part in raw_parts]
+        if not parts or not (_is_word_char(name[0]) and _is_word_char(name[-1])):
+            lookahead = "(?=" if overlapping else "("
+            pattern = re.compile(rf"{lookahead}\b{re.escape(name)}\b)", re.IGNORECASE)
+            return [(m.start(), m.start() + len(name)) for m in pattern.finditer(self.text)]
+        name_lower = name.lower()
+        length = len(name)
+        text = self.text
+        spans = []
+        last_end = -1
+        for start in self.starts(parts[0]):
+            end = start + length
+            if start < last_end and not overlapping:
+                continue
+            if len(parts) > 1 and text[start:end].lower() != name_lower:
+                continue
+            if len(parts) == 1 and end != start + len(raw_parts[0]):
+                continue
+            if end < len(text) and _is_word_char(text[end]):
+                continue
+            spans.append((start, end))
+            last_end = end
+        return spans
+
+    def to_bytes(self) -> dict:
+        """Postings packed for serialization: token -> bytes."""
+        packed = {}
+        for token, starts in self._postings.items():
+            if not isinstance(starts, bytes):
+                starts = array.array(_POSTING_TYPECODE, starts).tobytes()
+            packed[token] = starts
+        return packed
+
+
+def _write_compressed(path: str, obj):
+    """Write ``obj`` as zlib-compressed marshal data via an atomic rename."""
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(zlib.compress(marshal.dumps(obj), 1))
+        os.replace(tmp_path, path)
+    except BaseException:  # includes a corpus timeout firing mid-write
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _read_compressed(path: str):
+    """Read data written by _write_compressed, or None if unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return marshal.loads(zlib.decompress(f.read()))
+    except (OSError, ValueError, EOFError, TypeError, zlib.error):
+        return None
+
+
+class ParsedDocument:
+    """An S-1 parsed once and shared across every parser action.
+
+    Holds the raw and normalized full text, the section boundaries, a map
+    from normalized to raw text offsets and the pipeline-image flag, so
+    find_candidates, extract_passages and link_passages_to_trials can all
+    run against a single HTML parse. ``soup`` is only set when the
+    BeautifulSoup engine was used.
+    """
+
+    def __init__(
+        self,
+        full_text: str,
+        sections: list[dict],
+        pipeline_is_image: bool = None,
+        soup: BeautifulSoup = None,
+        source: str = "",
+    ):
+        self.source = source
+        self.soup = soup
+        self.full_text = full_text
+        (self.full_text_norm,
+         self._norm_breaks,
+         self._raw_breaks) = _normalize_with_offsets(full_text)
+        self.sections = sections
+        self._section_starts = [s["char_offset"] for s in sections]
+        self._pipeline_is_image = pipeline_is_image
+        self._text_index = None
+
+    @classmethod
+    def from_soup(cls, soup: BeautifulSoup, source: str = "") -> "ParsedDocument":
+        """Build from an already-parsed BeautifulSoup tree."""
+        full_text = soup.get_text(separator="\n", strip=True)
+        sections = _extract_sections(soup, full_text)
+        return cls(full_text, sections, soup=soup, source=source)
+
+    @classmethod
+    def from_file(cls, filepath: str, engine: str = "auto") -> "ParsedDocument":
+        """Load and parse an S-1 HTML file.
+
+        Args:
+            filepath: Path to the S-1 HTML file.
+            engine: "stream" (lxml pull parser, bounded memory), "soup"
+                (full BeautifulSoup tree) or "auto" — stream, falling back
+                to BeautifulSoup if lxml is missing or the stream fails.
+        """
+        if engine != "soup" and etree is not None:
+            try:
+                extracted = _stream_extract(filepath)
+                return cls(
+                    extracted["full_text"],
+                    extracted["sections"],
+                    pipeline_is_image=extracted["pipeline_is_image"],
+                    source=filepath,
+                )
+            except Exception as e:
+                # Any streaming failure must still yield output in auto mode.
+                if engine == "stream":
+                    raise
+                print(f"Streaming parse failed for {filepath}, "
+                      f"falling back to BeautifulSoup: {type(e).__name__}: {e}",
+                      file=sys.stderr)
+        elif engine == "stream":
+            raise RuntimeError("lxml is required for the streaming engine")
+        return cls.from_soup(_load_html(filepath), source=filepath)
+
+    @property
+    def pipeline_is_image(self) -> bool:
+        """Whether an <img> sits inside an element mentioning the pipeline."""
+        if self._pipeline_is_image is None:
+            self._pipeline_is_image = (
+                _detect_pipeline_image(self.soup) if self.soup is not None else False
+            )
+        return self._pipeline_is_image
+
+    @property
+    def text_index(self) -> TextIndex:
+        """Positional index over full_text_norm, built on first use."""
+        if self._text_index is None:
+            self._text_index = TextIndex(self.full_text_norm)
+        return self._text_index
+
+    def section_occurrences(self, name: str) -> list[tuple[dict, int, int]]:
+        """Occurrences of ``name`` as (section, start, end) within the section text.
+
+        Uses the positional index and maps its offsets back to the raw text
+        the sections are sliced from. Text before the first section is not
+        part of any section and is skipped.
+        """
+        hits = []
+        full_len = len(self.full_text)
+        for start, end in self.text_index.find(name):
+            raw_start = self.raw_offset(start)
+            i = bisect.bisect_right(self._section_starts, raw_start) - 1
+            if i < 0:
+                continue
+            section = self.sections[i]
+            section_end = (self._section_starts[i + 1]
+                           if i + 1 < len(self.sections) else full_len)
+            raw_end = raw_start + (end - start)
+            if raw_end > section_end:
+                continue
+            offset = section["char_offset"]
+            hits.append((section, raw_start - offset, raw_end - offset))
+        return hits
+
+    def to_payload(self) -> dict:
+        """The parsed text, sections and packed positional index, marshal-ready."""
+        return {
+            "version": INDEX_FORMAT_VERSION,
+            "typecode": _POSTING_TYPECODE,
+            "full_text": self.full_text,
+            "sections": [(s["name"], s["char_offset"]) for s in self.sections],
+            "pipeline_is_image": self.pipeline_is_image,
+            "postings": self.text_index.to_bytes(),
+        }
+
+    @classmethod
+    def from_payload(cls, payload, source: str = "") -> "ParsedDocument":
+        """Rebuild a document from ``to_payload`` output.
+
+        Returns None if the payload is from another format version.
+        """
+        if (not isinstance(payload, dict)
+                or payload.get("version") != INDEX_FORMAT_VERSION
+                or payload.get("typecode") != _POSTING_TYPECODE):
+            return None
+        full_text = payload["full_text"]
+        markers = payload["sections"]
+        sections = []
+        for i, (name, offset) in enumerate(markers):
+            end = markers[i + 1][1] if i + 1 < len(markers) else len(full_text)
+            sections.append({"name": name, "text": full_text[offset:end],
+                             "char_offset": offset})
+        doc = cls(full_text, sections,
+                  pipeline_is_image=payload["pipeline_is_image"], source=source)
+        doc._text_index = TextIndex(doc.full_text_norm, payload["postings"])
+        return doc
+
+    def save(self, path: str):
+        """Persist the parsed text, sections and positional index.
+
+        The file records the source's size and mtime so ``load`` can tell
+        when the HTML has changed. Only load files you wrote yourself.
+        """
+        stat = os.stat(self.source) if self.source else None
+        payload = self.to_payload()
+        payload["source_size"] = stat.st_size if stat else None
+        payload["source_mtime"] = stat.st_mtime_ns if stat else None
+        _write_compressed(path, payload)
+
+    @classmethod
+    def load(cls, path: str, source: str = "") -> "ParsedDocument":
+        """Load a document written by ``save``.
+
+        Returns None if the file is unreadable, from another format
+        version, or stale with respect to ``source``.
+        """
+        payload = _read_compressed(path)
+        if not isinstance(payload, dict):
+            return None
+        if source:
+            try:
+                stat = os.stat(source)
+            except OSError:
+                return None
+            if (payload.get("source_size"), payload.get("source_mtime")) != (
+                    stat.st_size, stat.st_mtime_ns):
+                return None
+        return cls.from_payload(payload, source=source)
+
+    def raw_offset(self, norm_offset: int) -> int:
+        """Map an offset in full_text_norm back to an offset in full_text."""
+        i = bisect.bisect_right(self._norm_breaks, norm_offset) - 1
+        return self._raw_breaks[i] + (norm_offset - self._norm_breaks[i])
+
+    def section_at(self, raw_offset: int) -> dict:
+        """Return the section containing a raw full_text offset."""
+        i = bisect.bisect_right(self._section_starts, raw_offset) - 1
+        return self.sections[max(i, 0)]
+
+    def window(self, raw_offset: int, max_context: int = 800) -> str:
+        """Return the passage window around a raw offset, clipped to its section.
+
+        Mirrors the windowing used by _extract_passages_for_name.
+        """
+        section = self.section_at(raw_offset)
+        text = section["text"]
+        rel = raw_offset - section["char_offset"]
+        start = max(0, rel - max_context // 2)
+        end = min(len(text), rel + max_context // 2)
+        return text[start:end].strip()
+
+
+def _as_document(source) -> ParsedDocument:
+    """Accept either a ParsedDocument or a path to an S-1 HTML file."""
+    if isinstance(source, ParsedDocument):
+        return source
+    return ParsedDocument.from_file(source)
+
+
+# ── Parse Cache ───────────────────────────────────────────────────────
+
+# Bump whenever a change alters parse output, so stale cache entries miss.
+PARSER_VERSION = 1
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "s1_checker", "parse",
+)
+DEFAULT_CACHE_MAX_MB = 1024
+CACHE_EVICT_EVERY = 64       # writes between size-budget checks
+CACHE_TMP_MAX_AGE = 3600     # seconds before an orphaned *.tmp is removed
+
+
+class ParseCache:
+    """Content-addressed, size-bounded on-disk cache of S-1 parse results.
+
+    Entries are keyed by the SHA-256 of the HTML bytes plus PARSER_VERSION,
+    so re-running on the same filing (under any file name) skips the parse.
+    Two kinds of entry are stored, both as zlib-compressed marshal data:
+
+        <key>.doc              parsed text, sections and positional index
+        <key>.<digest>.cand    find_candidates output for a given red flag
+                               phrase list (digest = RedFlagRegistry.digest)
+
+    Reads bump an entry's mtime; when the directory grows past
+    ``max_bytes`` the least recently used entries are evicted, checked
+    every CACHE_EVICT_EVERY writes and on ``flush_stats``. Hit, miss and
+    eviction counts are kept per instance and added to stats.json (under
+    a file lock) by ``flush_stats``.
+    """
+
+    STATS_FILE = "stats.json"
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = None):
+        self.cache_dir = cache_dir or os.environ.get("S1_PARSER_CACHE_DIR", DEFAULT_CACHE_DIR)
+        if max_bytes is None:
+            max_mb = float(os.environ.get("S1_PARSER_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB))
+            max_bytes = int(max_mb * 1024 * 1024)
+        self.max_bytes = max_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.session = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._writes_since_evict = 0
+
+    @staticmethod
+    def key_for(filepath: str) -> str:
+        """Content key: SHA-256 of the document's (uncompressed) bytes and
+        the parser version."""
+        h = hashlib.sha256(f"s1_parser/{PARSER_VERSION}\n".encode("ascii"))
+        with open_filing(filepath) as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        return h.hexdigest()
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, name)
+
+    def get(self, name: str, count_miss: bool = True):
+        """Return a cached object, or None on a miss.
+
+        With ``count_miss=False`` a miss is not counted, for lookups that
+        fall back to another entry rather than to a parse.
+        """
+        path = self._path(name)
+        obj = _read_compressed(path)
+        if obj is None:
+            if count_miss:
+                self.session["misses"] += 1
+            return None
+        self.session["hits"] += 1
+        try:
+            os.utime(path)  # LRU recency
+        except OSError:
+            pass
+        return obj
+
+    def put(self, name: str, obj):
+        """Store an object; every CACHE_EVICT_EVERY writes, evict least
+        recently used entries if over budget."""
+        _write_compressed(self._path(name), obj)
+        self.session["writes"] += 1
+        self._writes_since_evict += 1
+        if self._writes_since_evict >= CACHE_EVICT_EVERY:
+            self._evict()
+
+    def get_document(self, key: str, source: str = "") -> "ParsedDocument":
+        payload = self.get(f"{key}.doc")
+        return ParsedDocument.from_payload(payload, source=source) if payload else None
+
+    def put_document(self, key: str, doc: "ParsedDocument"):
+        self.put(f"{key}.doc", doc.to_payload())
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, name) of every cache entry. Temp files left by
+        interrupted writes are removed once older than CACHE_TMP_MAX_AGE."""
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.cache_dir):
+            if name == self.STATS_FILE or name.startswith(f"{self.STATS_FILE}."):
+                continue
+            try:
+                st = os.stat(self._path(name))
+            except OSError:
+                continue
+            if name.endswith(".tmp"):
+                if now - st.st_mtime > CACHE_TMP_MAX_AGE:
+                    try:
+                        os.remove(self._path(name))
+                    except OSError:
+                        pass
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+        return entries
+
+    def _evict(self):
+        self._writes_since_evict = 0
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        if total <= self.max_bytes:
+            return
+        for _, size, name in sorted(entries):
+            try:
+                os.remove(self._path(name))
+            except OSError:
+                continue
+            total -= size
+            self.session["evictions"] += 1
+            if total <= self.max_bytes:
+                break
+
+    def take_session(self) -> dict:
+        """This instance's counts since the last flush, resetting them."""
+        counts, self.session = self.session, {k: 0 for k in self.session}
+        return counts
+
+    def flush_stats(self, counts: dict = None) -> dict:
+        """Apply the size budget, add this session's counts (plus ``counts``,
+        e.g. merged from worker processes) to stats.json and return the
+        totals."""
+        self._evict()
+        counts = {k: v + (counts or {}).get(k, 0) for k, v in self.take_session().items()}
+        stats_path = self._path(self.STATS_FILE)
+        with open(f"{stats_path}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                with open(stats_path, "r", encoding="utf-8") as f:
+                    totals = json.load(f)
+            except (OSError, ValueError):
+                totals = {}
+            for k, v in counts.items():
+                totals[k] = totals.get(k, 0) + v
+            tmp_path = f"{stats_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(totals, f)
+            os.replace(tmp_path, stats_path)
+        return totals
+
+    def stats(self) -> dict:
+        """Cumulative counters plus current size and entry count."""
+        totals = self.flush_stats()
+        entries = self._entries()
+        lookups = totals.get("hits", 0) + totals.get("misses", 0)
+        return {
+            **totals,
+            "hit_rate": round(totals.get("hits", 0) / lookups, 3) if lookups else None,
+            "entries": len(entries),
+            "bytes": sum(size for _, size, _ in entries),
+            "max_bytes": self.max_bytes,
+            "cache_dir": self.cache_dir,
+        }
+
+
+def load_document(
+    filepath: str,
+    engine: str = "auto",
+    cache: ParseCache = None,
+    index: str = None,
+    key: str = None,
+) -> "ParsedDocument":
+    """Parsed document for ``filepath``: from a current ``index`` file, the
+    parse cache, or a fresh parse (which then populates both).
+
+    ``key`` is the file's ParseCache.key_for, if the caller already has it.
+    """
+    doc = ParsedDocument.load(index, source=filepath) if index else None
+    if doc is None:
+        if cache and not key:
+            key = cache.key_for(filepath)
+        doc = cache.get_document(key, source=filepath) if cache else None
+        if doc is None:
+            doc = ParsedDocument.from_file(filepath, engine=engine)
+            if cache:
+                cache.put_document(key, doc)
+        if index:
+            doc.save(index)
+    return doc
+
+
+def cached_find_candidates(
+    filepath: str,
+    engine: str = "auto",
+    cache: ParseCache = None,
+    index: str = None,
+) -> dict:
+    """``find_candidates`` for a file, reusing a cached result when the HTML
+    and red flag phrase list are unchanged."""
+    if cache is None:
+        return find_candidates(load_document(filepath, engine, index=index))
+    key = cache.key_for(filepath)
+    name = f"{key}.{_RED_FLAG_REGISTRY.digest[:16]}.cand"
+    # A .cand miss falls back to the .doc entry; only that lookup counts
+    # the miss, so one cold file is one miss.
+    result = cache.get(name, count_miss=False)
+    if result is None:
+        result = find_candidates(load_document(filepath, engine, cache, index, key=key))
+        cache.put(name, result)
+    return result
+
+
 # ── Main Actions ──────────────────────────────────────────────────────
 
-def find_candidates(filepath: str) -> dict:
-    """Parse S-1, identify drug candidates, extract passages, flag patterns."""
-    soup = _load_html(filepath)
-    sections = _extract_sections(soup)
-    full_text = soup.get_text(separator="\n", strip=True)
-    full_text_norm = _normalize_text(full_text)
+def find_candidates(source) -> dict:
+    """Parse S-1, identify drug candidates, extract passages, flag patterns.
+
+    Args:
+        source: A ParsedDocument, or a path to the S-1 HTML file.
+    """
+    doc = _as_document(source)
+    sections = doc.sections
+    full_text = doc.full_text
+    full_text_norm = doc.full_text_norm
 
     # Find NCT numbers
     nct_numbers = list(set(NCT_RE.findall(full_text_norm)))
 
     # Find candidate names
-    raw_candidates = _find_candidate_names(full_text_norm)
+    scan = CandidateScan(full_text_norm)
+    raw_candidates = _find_candidate_names(full_text_norm, scan)
 
     # Score each candidate for ownership and filter
     scored = []
     for cand in raw_candidates:
-        score = _score_ownership(cand["name"], full_text_norm)
+        score = _score_ownership(cand["name"], full_text_norm, scan)
         cand["ownership_score"] = score
         scored.append(cand)
 
@@ -636,7 +1786,7 @@ def find_candidates(filepath: str) -> dict:
     candidates = []
     for cand in company_candidates:
         name = cand["name"]
-        passages = _extract_passages_for_name(name, sections)
+        passages = _extract_passages_for_name(name, sections, doc=doc)
 
         # Aggregate all passage text for this candidate (normalized)
         all_text = _normalize_text(" ".join(p["text"] for p in passages))
@@ -693,33 +1843,15 @@ def find_candidates(filepath: str) -> dict:
         # Find aliases — require explicit alias patterns like
         # "name (alias)" or "name, also known as alias"
         also_known_as = []
-        alias_pats = [
-            # "izokibep (SLRN-801)" or "SLRN-801 (izokibep)"
-            re.compile(
-                rf"\b{re.escape(name)}\b\s*\(([^)]+)\)",
-                re.IGNORECASE,
-            ),
-            re.compile(
-                rf"\(({re.escape(name)})\)",
-                re.IGNORECASE,
-            ),
-            # "name, also known as X" / "name, formerly known as X"
-            re.compile(
-                rf"\b{re.escape(name)}\b[,\s]+(?:also|formerly|previously)\s+known\s+as\s+(\S+)",
-                re.IGNORECASE,
-            ),
-        ]
-        for apn in alias_pats:
-            for m in apn.finditer(full_text_norm):
-                alias_text = m.group(1).strip()
-                # Check if the alias is another known candidate name
-                for other in raw_candidates:
-                    if other["name"] == name:
-                        continue
-                    if re.search(rf"\b{re.escape(other['name'])}\b",
-                                 alias_text, re.IGNORECASE):
-                        if other["name"] not in also_known_as:
-                            also_known_as.append(other["name"])
+        for alias_text in _alias_texts(name, doc.text_index):
+            # Check if the alias is another known candidate name
+            for other in raw_candidates:
+                if other["name"] == name:
+                    continue
+                if re.search(rf"\b{re.escape(other['name'])}\b",
+                             alias_text, re.IGNORECASE):
+                    if other["name"] not in also_known_as:
+                        also_known_as.append(other["name"])
 
         # FDA mentions
         fda_hits = _scan_fda_language(all_text)
@@ -780,7 +1912,6 @@ def find_candidates(filepath: str) -> dict:
 
     # Pipeline table text — look for table near "pipeline" keyword
     pipeline_table_text = ""
-    pipeline_is_image = False
     for section in sections:
         sec_text_lower = section["text"][:5000].lower()
         if "pipeline" in sec_text_lower or "our programs" in sec_text_lower:
@@ -788,17 +1919,7 @@ def find_candidates(filepath: str) -> dict:
             break
 
     # Check for pipeline images in HTML — look near "pipeline" text
-    for img in soup.find_all("img"):
-        # Check surrounding context for "pipeline" keywords
-        parent = img.parent
-        while parent and parent.name not in ("body", "html", None):
-            parent_text = parent.get_text(strip=True).lower()[:500]
-            if "pipeline" in parent_text or "our programs" in parent_text:
-                pipeline_is_image = True
-                break
-            parent = parent.parent
-        if pipeline_is_image:
-            break
+    pipeline_is_image = doc.pipeline_is_image
 
     # General statements (company-wide, not tied to one candidate)
     general_statements = []
@@ -826,15 +1947,21 @@ def find_candidates(filepath: str) -> dict:
     return result
 
 
-def extract_passages(filepath: str, nct_number: str) -> list[dict]:
-    """Extract all S-1 passages referencing a specific NCT number."""
-    soup = _load_html(filepath)
-    sections = _extract_sections(soup)
-    return _extract_passages_for_name(nct_number, sections)
+def extract_passages(source, nct_number: str) -> list[dict]:
+    """Extract all S-1 passages referencing a specific NCT number.
+
+    Args:
+        source: A ParsedDocument, or a path to the S-1 HTML file.
+        nct_number: NCT ID to look for.
+    """
+    doc = _as_document(source)
+    return _extract_passages_for_name(nct_number, doc.sections, doc=doc)
 
 
 def link_passages_to_trials(
-    passages: list[dict], ctgov_trials: list[dict]
+    passages: list[dict],
+    ctgov_trials: list[dict],
+    doc: ParsedDocument = None,
 ) -> list[dict]:
     """Link S-1 passages to specific ClinicalTrials.gov trials.
 
@@ -846,12 +1973,18 @@ def link_passages_to_trials(
     Args:
         passages: List of passage dicts with "text" and "section" keys
         ctgov_trials: List of CTgov trial dicts with identification, design info
+        doc: Optional ParsedDocument the passages came from. When given,
+            passages carrying a "char_offset" are matched against their
+            full window in the document rather than the (possibly
+            truncated) passage text.
 
     Returns:
         passages annotated with "trial_nct_id" or "UNMATCHED"
     """
     for passage in passages:
         text = passage.get("text", "")
+        if doc is not None and "char_offset" in passage:
+            text = _normalize_text(doc.window(passage["char_offset"])) or text
         matched_nct = None
         match_method = None
 
@@ -929,27 +2062,190 @@ def link_passages_to_trials(
     return passages
 
 
+# ── Corpus Mode ───────────────────────────────────────────────────────
+
+CORPUS_SUFFIXES = (".htm", ".html", ".htm.gz", ".html.gz")
+CORPUS_CHUNKSIZE = 4
+CORPUS_FILE_TIMEOUT = 300  # seconds per filing
+
+_CORPUS_CACHE = None  # per-worker ParseCache, set by _corpus_worker_init
+
+
+class _FileTimeout(BaseException):
+    """Per-file time limit hit; not an Exception, so the engine fallback
+    in ParsedDocument.from_file does not swallow it."""
+
+
+def _corpus_files(spec: str) -> list[str]:
+    """S-1 paths from a directory (searched recursively) or a manifest.
+
+    A manifest is a JSON list of paths, or a text file with one path per
+    line; relative entries are resolved against the manifest's directory.
+    """
+    if os.path.isdir(spec):
+        files = []
+        for root, _, names in os.walk(spec):
+            files.extend(os.path.join(root, n) for n in names
+                         if n.lower().endswith(CORPUS_SUFFIXES))
+        return sorted(files)
+    with open(spec, "r", encoding="utf-8") as f:
+        raw = f.read()
+    try:
+        entries = json.loads(raw)
+    except ValueError:
+        entries = [line.strip() for line in raw.splitlines()
+                   if line.strip() and not line.lstrip().startswith("#")]
+    base = os.path.dirname(os.path.abspath(spec))
+    return [e if e.startswith(ARCHIVE_PREFIX) else os.path.join(base, e) for e in entries]
+
+
+def _corpus_worker_init(cache_dir: str, use_cache: bool):
+    """Pool initializer: load the red flag registry and open the cache once."""
+    global _CORPUS_CACHE
+    _RED_FLAG_REGISTRY.scanner  # loads phrase tiers and compiles the scanner
+    _CORPUS_CACHE = ParseCache(cache_dir) if use_cache else None
+
+
+def _raise_timeout(signum, frame):
+    raise _FileTimeout()
+
+
+def _corpus_task(task: tuple[str, str, float]) -> dict:
+    """Run find_candidates on one file; never raises."""
+    filepath, engine, timeout = task
+    record = {"file": filepath}
+    use_alarm = bool(timeout) and hasattr(signal, "SIGALRM")
+    start = time.perf_counter()
+    try:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, _raise_timeout)
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        result = cached_find_candidates(resolve_filing_path(filepath), engine, _CORPUS_CACHE)
+        record.update(status="ok", candidate_count=len(result.get("candidates", [])),
+                      result=result)
+    except _FileTimeout:
+        record.update(status="timeout", error=f"exceeded {timeout:g} s")
+    except Exception as e:
+        record.update(status="error", error=f"{type(e).__name__}: {e}")
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    record["elapsed_s"] = round(time.perf_counter() - start, 3)
+    if _CORPUS_CACHE:
+        # Merged into stats.json once, by run_corpus
+        record["cache_counts"] = _CORPUS_CACHE.take_session()
+    return record
+
+
+def run_corpus(
+    files: list[str],
+    out,
+    workers: int = None,
+    chunksize: int = CORPUS_CHUNKSIZE,
+    timeout: float = CORPUS_FILE_TIMEOUT,
+    engine: str = "auto",
+    cache_dir: str = None,
+    use_cache: bool = True,
+) -> dict:
+    """find_candidates over ``files`` in a process pool, one JSONL record
+    per file written to ``out`` as it completes. Returns status counts."""
+    workers = workers or os.cpu_count() or 1
+    tasks = [(f, engine, timeout) for f in files]
+    counts = {}
+    cache_counts = {}
+    with multiprocessing.Pool(workers, initializer=_corpus_worker_init,
+                              initargs=(cache_dir, use_cache)) as pool:
+        for record in pool.imap_unordered(_corpus_task, tasks, chunksize=chunksize):
+            for k, v in record.pop("cache_counts", {}).items():
+                cache_counts[k] = cache_counts.get(k, 0) + v
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+            counts[record["status"]] = counts.get(record["status"], 0) + 1
+    if use_cache:
+        # One size-budget pass and one stats.json update for the whole run
+        ParseCache(cache_dir).flush_stats(cache_counts)
+    return counts
+
+
 # ── CLI ───────────────────────────────────────────────────────────────
 
 def main():
     parser = argparse.ArgumentParser(description="S-1 parser for drug candidate extraction")
     parser.add_argument("--action", required=True,
-                        choices=["find_candidates", "extract_passages"])
-    parser.add_argument("--file", required=True, help="Path to S-1 HTML file")
+                        choices=["find_candidates", "extract_passages", "corpus"])
+    parser.add_argument("--file",
+                        help="Path to S-1 HTML file (plain or gzipped), or archive:<accession>")
+    parser.add_argument("--corpus",
+                        help="Directory of S-1 files, or a manifest listing them (for corpus)")
+    parser.add_argument("--output", help="JSONL output path (for corpus; default: stdout)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for corpus (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, default=CORPUS_CHUNKSIZE,
+                        help=f"Files handed to a worker at a time (default: {CORPUS_CHUNKSIZE})")
+    parser.add_argument("--timeout", type=float, default=CORPUS_FILE_TIMEOUT,
+                        help=f"Per-file time limit in seconds, 0 for none "
+                             f"(default: {CORPUS_FILE_TIMEOUT})")
     parser.add_argument("--nct", help="NCT number (for extract_passages)")
+    parser.add_argument("--engine", default="auto", choices=["auto", "stream", "soup"],
+                        help="HTML engine: stream (lxml, bounded memory), soup "
+                             "(BeautifulSoup), or auto (stream with soup fallback)")
+    parser.add_argument("--index", help="Path of a persisted parse + positional index; "
+                                            "reused when current, rewritten otherwise")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Bypass the content-addressed parse cache")
+    parser.add_argument("--cache-dir", default=None,
+                        help=f"Parse cache directory (default: $S1_PARSER_CACHE_DIR "
+                             f"or {DEFAULT_CACHE_DIR})")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="Print cumulative parse cache statistics to stderr")
     args = parser.parse_args()
 
+    if args.action == "corpus":
+        if not args.corpus:
+            raise SystemExit("--corpus required for corpus")
+        files = _corpus_files(args.corpus)
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        start = time.perf_counter()
+        try:
+            counts = run_corpus(files, out, args.workers, args.chunksize, args.timeout,
+                                args.engine, args.cache_dir, not args.no_cache)
+        finally:
+            if args.output:
+                out.close()
+        elapsed = time.perf_counter() - start
+        summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+        print(f"Corpus: {len(files)} files ({summary}) in {elapsed:.1f} s, "
+              f"{len(files) / elapsed if elapsed else 0:.1f} files/s", file=sys.stderr)
+        if args.cache_stats and not args.no_cache:
+            print(f"Parse cache: {json.dumps(ParseCache(args.cache_dir).stats())}",
+                  file=sys.stderr)
+        return
+
+    if not args.file:
+        raise SystemExit("--file required for find_candidates and extract_passages")
+    try:
+        args.file = resolve_filing_path(args.file)
+    except FileNotFoundError as e:
+        raise SystemExit(str(e))
     if not os.path.exists(args.file):
         raise SystemExit(f"File not found: {args.file}")
+    if args.action == "extract_passages" and not args.nct:
+        raise SystemExit("--nct required for extract_passages")
 
+    cache = None if args.no_cache else ParseCache(args.cache_dir)
     if args.action == "find_candidates":
-        result = find_candidates(args.file)
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        result = cached_find_candidates(args.file, args.engine, cache, args.index)
     elif args.action == "extract_passages":
-        if not args.nct:
-            raise SystemExit("--nct required for extract_passages")
-        passages = extract_passages(args.file, args.nct)
-        print(json.dumps(passages, indent=2, ensure_ascii=False))
+        doc = load_document(args.file, args.engine, cache, args.index)
+        result = extract_passages(doc, args.nct)
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+    if cache:
+        if args.cache_stats:
+            print(f"Parse cache: {json.dumps(cache.stats())}", file=sys.stderr)
+        else:
+            cache.flush_stats()
 
 
 if __name__ == "__main__":
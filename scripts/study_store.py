@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+study_store.py — Shared local store of ClinicalTrials.gov study records.
+
+One SQLite database holds every fetched study exactly once, keyed by NCT
+ID, with the raw API record and the structured extraction. Per-drug
+manifests written by ctgov_fetch only reference studies by NCT ID, so a
+study reached through the INN, a designator, a combination partner or
+another filer is fetched and stored once.
+
+Records are stored as compact JSON, one zlib-compressed frame per
+top-level module (``design``, ``results``, ``resultsSection``, ...), so a
+reader asking for a few modules never decompresses or parses the rest.
+orjson is used for (de)serialization when installed.
+
+Usage:
+    python scripts/study_store.py stats
+    python scripts/study_store.py get --nct NCT05355805
+    python scripts/study_store.py get --nct NCT05355805 --module status --module design
+    python scripts/study_store.py get --nct NCT05355805 --raw
+    python scripts/study_store.py export --nct NCT05355805 --output-dir debug/
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+STUDY_STORE_PATH = os.environ.get("S1_STUDY_STORE") or os.path.join(
+    os.environ.get("XDG_DATA_HOME", os.path.join(os.path.expanduser("~"), ".local", "share")),
+    "s1_checker", "studies.sqlite3",
+)
+STORE_TTL = 24 * 3600  # seconds a record is trusted when no version marker is known
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS studies (
+    nct_id           TEXT PRIMARY KEY,
+    last_update_date TEXT NOT NULL DEFAULT '',
+    has_results      INTEGER NOT NULL DEFAULT 0,
+    fetched_at       REAL NOT NULL,
+    raw              BLOB NOT NULL,
+    structured       BLOB NOT NULL
+)
+"""
+
+
+ZLIB_LEVEL = 6
+FRAME_MAGIC = b"SSM1"  # module-framed record; older rows are one zlib stream
+
+
+def _dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _pack(record: dict) -> bytes:
+    """Serialize ``record`` as one compressed frame per top-level key.
+
+    Layout: FRAME_MAGIC, a 4-byte big-endian header length, a JSON header
+    mapping each key to [offset, length] in the body, then the body.
+    """
+    header = {}
+    frames = []
+    offset = 0
+    for key, value in record.items():
+        frame = zlib.compress(_dumps(value), ZLIB_LEVEL)
+        header[key] = [offset, len(frame)]
+        frames.append(frame)
+        offset += len(frame)
+    header_bytes = _dumps(header)
+    return b"".join([FRAME_MAGIC, len(header_bytes).to_bytes(4, "big"), header_bytes, *frames])
+
+
+def _unpack(blob: bytes, modules=None) -> dict:
+    """Deserialize a packed record, decoding only ``modules`` if given."""
+    if not blob.startswith(FRAME_MAGIC):
+        record = _loads(zlib.decompress(blob))
+        return record if modules is None else {k: record[k] for k in modules if k in record}
+    start = len(FRAME_MAGIC) + 4
+    header_len = int.from_bytes(blob[len(FRAME_MAGIC):start], "big")
+    header = _loads(blob[start:start + header_len])
+    body = memoryview(blob)[start + header_len:]
+    keys = header if modules is None else [k for k in modules if k in header]
+    record = {}
+    for key in keys:
+        offset, length = header[key]
+        record[key] = _loads(zlib.decompress(body[offset:offset + length]))
+    return record
+
+
+class StudyStore:
+    """NCT-keyed SQLite store of raw and structured study records.
+
+    Safe to share between threads (one connection per thread) and between
+    processes (WAL journal).
+    """
+
+    def __init__(self, path: str = STUDY_STORE_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, nct_id: str, raw: dict, structured: dict):
+        """Insert or replace one study."""
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO studies VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    nct_id,
+                    structured.get("status", {}).get("last_update_date", ""),
+                    int(bool(structured.get("has_results"))),
+                    time.time(),
+                    _pack(raw),
+                    _pack(structured),
+                ),
+            )
+
+    def meta(self, nct_id: str) -> dict | None:
+        row = self._conn().execute(
+            "SELECT last_update_date, has_results, fetched_at FROM studies WHERE nct_id = ?",
+            (nct_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        return {"last_update_date": row[0], "has_results": bool(row[1]), "fetched_at": row[2]}
+
+    def is_current(self, nct_id: str, last_update_date: str = None, max_age: float = STORE_TTL) -> bool:
+        """Whether the stored copy can stand in for a fresh fetch.
+
+        With a version marker (lastUpdatePostDate from a search hit) the
+        stored marker must match; without one the copy must be younger
+        than ``max_age`` seconds.
+        """
+        meta = self.meta(nct_id)
+        if meta is None:
+            return False
+        if last_update_date:
+            return meta["last_update_date"] == last_update_date
+        return time.time() - meta["fetched_at"] < max_age
+
+    def _get(self, column: str, nct_id: str, modules):
+        row = self._conn().execute(
+            f"SELECT {column} FROM studies WHERE nct_id = ?", (nct_id,)
+        ).fetchone()
+        return _unpack(row[0], modules) if row else None
+
+    def get_structured(self, nct_id: str, modules=None) -> dict | None:
+        """Structured record, limited to the top-level ``modules`` if given."""
+        return self._get("structured", nct_id, modules)
+
+    def get_raw(self, nct_id: str, modules=None) -> dict | None:
+        """Raw API record, limited to the top-level ``modules`` if given
+        (e.g. ``("protocolSection",)`` skips ``resultsSection``)."""
+        return self._get("raw", nct_id, modules)
+
+    def export_json(self, nct_id: str, output_dir: str) -> dict:
+        """Write ctgov_<NCT>.json and ctgov_<NCT>_structured.json (indented)
+        for debugging. Returns their paths as raw_file / structured_file."""
+        paths = {}
+        for key, suffix, record in (
+            ("raw_file", "", self.get_raw(nct_id)),
+            ("structured_file", "_structured", self.get_structured(nct_id)),
+        ):
+            if record is None:
+                raise KeyError(f"{nct_id} is not in the study store: {self.path}")
+            path = os.path.join(output_dir, f"ctgov_{nct_id}{suffix}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(record, f, indent=2, ensure_ascii=False)
+            paths[key] = path
+        return paths
+
+    def __contains__(self, nct_id: str) -> bool:
+        return self.meta(nct_id) is not None
+
+    def stats(self) -> dict:
+        count, with_results, raw_bytes, structured_bytes = self._conn().execute(
+            "SELECT COUNT(*), COALESCE(SUM(has_results), 0), "
+            "COALESCE(SUM(LENGTH(raw)), 0), COALESCE(SUM(LENGTH(structured)), 0) FROM studies"
+        ).fetchone()
+        return {
+            "path": self.path,
+            "studies": count,
+            "studies_with_results": with_results,
+            "raw_bytes": raw_bytes,
+            "structured_bytes": structured_bytes,
+            "file_bytes": os.path.getsize(self.path),
+        }
+
+
+_STORES = {}
+_STORES_LOCK = threading.Lock()
+
+
+def get_store(path: str = None) -> StudyStore:
+    """Process-wide StudyStore for ``path`` (default STUDY_STORE_PATH)."""
+    path = path or STUDY_STORE_PATH
+    with _STORES_LOCK:
+        if path not in _STORES:
+            _STORES[path] = StudyStore(path)
+        return _STORES[path]
+
+
+# ── CLI ───────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="Local ClinicalTrials.gov study store")
+    parser.add_argument("--store", default=STUDY_STORE_PATH,
+                        help=f"Store path (default: $S1_STUDY_STORE or {STUDY_STORE_PATH})")
+    subparsers = parser.add_subparsers(dest="action", help="Action to perform")
+    subparsers.add_parser("stats", help="Show store size and study counts")
+    get_parser = subparsers.add_parser("get", help="Print a stored study as JSON")
+    get_parser.add_argument("--nct", required=True, help="NCT number")
+    get_parser.add_argument("--raw", action="store_true",
+                            help="Print the raw API record instead of the structured one")
+    get_parser.add_argument("--module", action="append", default=None,
+                            help="Top-level module to print (repeatable; default: all)")
+    export_parser = subparsers.add_parser("export", help="Write a stored study as indented JSON files")
+    export_parser.add_argument("--nct", required=True, help="NCT number")
+    export_parser.add_argument("--output-dir", default=".",
+                               help="Directory for the JSON files (default: current directory)")
+    args = parser.parse_args()
+
+    store = StudyStore(args.store)
+    if args.action == "stats":
+        print(json.dumps(store.stats(), indent=2))
+    elif args.action == "get":
+        nct_id = args.nct.strip().upper()
+        if args.raw:
+            study = store.get_raw(nct_id, args.module)
+        else:
+            study = store.get_structured(nct_id, args.module)
+        if study is None:
+            raise SystemExit(f"{nct_id} is not in the study store: {args.store}")
+        print(json.dumps(study, indent=2, ensure_ascii=False))
+    elif args.action == "export":
+        os.makedirs(args.output_dir, exist_ok=True)
+        try:
+            paths = store.export_json(args.nct.strip().upper(), args.output_dir)
+        except KeyError as e:
+            raise SystemExit(e.args[0])
+        print(json.dumps(paths, indent=2))
+    else:
+        parser.print_help()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()